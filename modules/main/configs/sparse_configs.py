@@ -1,7 +1,6 @@
 import modules.main.util.constants as C
 from modules.main.configs.sparse_configs_validation import validate
 import modules.main.util.utilities as utilities
-import json
 
 
 class SparseConfigs:
@@ -11,7 +10,31 @@ class SparseConfigs:
     Attributes:
         config_file (str): The path to the configs JSON file.
     """
-    
+
+    # Fixed attribute layout: skips the per-instance __dict__ and makes the getters used in GUI event loops a
+    # fixed-offset read. Names are listed in mangled form because of the double-underscore privates.
+    __slots__ = (
+        "_SparseConfigs__album_length_threshold_min",
+        "_SparseConfigs__client_id",
+        "_SparseConfigs__client_secret",
+        "_SparseConfigs__genre_names_cache",
+        "_SparseConfigs__genre_playlists_by_name",
+        "_SparseConfigs__genre_playlists_file_path",
+        "_SparseConfigs__genres_dirty",
+        "_SparseConfigs__overrides_dirty",
+        "_SparseConfigs__playlists_dirty",
+        "_SparseConfigs__ranked_album_genres_by_album_key",
+        "_SparseConfigs__ranked_album_genres_file_path",
+        "_SparseConfigs__ranker_output_path",
+        "_SparseConfigs__ranker_overrides",
+        "_SparseConfigs__ranker_overrides_file_path",
+        "_SparseConfigs__tier_1_playlist_id",
+        "_SparseConfigs__tier_2_playlist_id",
+        "_SparseConfigs__tier_3_playlist_id",
+        "_SparseConfigs__tier_3_yearly_threshold",
+        "_SparseConfigs__user"
+    )
+
 
     def __init__(self, configs_file_path: str = "./config.json"):
         """
@@ -30,11 +53,18 @@ class SparseConfigs:
         self.__client_id = configs[C.CLIENT_ID_KEY]
         self.__client_secret = configs[C.CLIENT_SECRET_KEY]
         self.__genre_playlists_file_path = configs[C.GENRE_PLAYLISTS_FILE_PATH_KEY]
-        self.__genre_playlists_by_name = utilities.read_json_file(file_path=configs[C.GENRE_PLAYLISTS_FILE_PATH_KEY])
         self.__ranked_album_genres_file_path = configs[C.RANKED_ALBUM_GENRES_FILE_PATH_KEY]
-        self.__ranked_album_genres_by_album_key = utilities.read_json_file(file_path=configs[C.RANKED_ALBUM_GENRES_FILE_PATH_KEY])
         self.__ranker_overrides_file_path = configs[C.RANKER_OVERRIDE_FILE_PATH_KEY]
-        self.__ranker_overrides = utilities.read_json_file(file_path=configs[C.RANKER_OVERRIDE_FILE_PATH_KEY])
+
+        # The genre playlists, ranked album genres and ranker overrides stores are parsed lazily on first access.
+        # Callers that only need credentials or paths (e.g. the ranker popup) then never pay for parsing them.
+        self.__genre_playlists_by_name = None
+        self.__ranked_album_genres_by_album_key = None
+        self.__ranker_overrides = None
+
+        # Snapshot of the genre names, rebuilt only when the playlists store changes so repeated name listings don't
+        # re-walk the dict keys.
+        self.__genre_names_cache = None
         self.__ranker_output_path = configs[C.RANKER_OUTPUT_FILE_PATH_KEY]
         self.__tier_1_playlist_id = configs[C.TIER_1_PLAYLIST_ID_KEY]
         self.__tier_2_playlist_id = configs[C.TIER_2_PLAYLIST_ID_KEY]
@@ -42,6 +72,12 @@ class SparseConfigs:
         self.__tier_3_yearly_threshold = configs[C.TIER_3_YEARLY_THRESHOLD_KEY]
         self.__user = configs[C.USER_KEY]
 
+        # Dirty flags for the mutable config stores. Mutations only touch memory; disk writes are deferred to
+        # flush_all() so a burst of updates costs one file rewrite instead of one per key.
+        self.__genres_dirty = False
+        self.__overrides_dirty = False
+        self.__playlists_dirty = False
+
 
     def __get_configs_from_file(self, configs_file_path: str) -> dict:
         """
@@ -60,14 +96,42 @@ class SparseConfigs:
             raise FileNotFoundError(f"The config file couldn't be found at `{configs_file_path}`.")
         
 
+    def __get_genre_playlists(self) -> dict:
+        """Get the mapping from genre name to Spotify playlist ID, loading it from disk on first access."""
+        if self.__genre_playlists_by_name is None:
+            self.__genre_playlists_by_name = utilities.read_json_file(file_path=self.__genre_playlists_file_path)
+        return self.__genre_playlists_by_name
+
+
+    def __get_ranked_album_genres(self) -> dict:
+        """Get the mapping from album key to genre data, loading it from disk on first access."""
+        if self.__ranked_album_genres_by_album_key is None:
+            self.__ranked_album_genres_by_album_key = utilities.read_json_file(file_path=self.__ranked_album_genres_file_path)
+        return self.__ranked_album_genres_by_album_key
+
+
+    def __get_ranker_overrides(self) -> dict:
+        """Get the mapping from album key to override data, loading it from disk on first access."""
+        if self.__ranker_overrides is None:
+            self.__ranker_overrides = utilities.read_json_file(file_path=self.__ranker_overrides_file_path)
+        return self.__ranker_overrides
+
+
     def get_album_length_threshold_min(self) -> int:
         """Get the Album length threshold in minutes. All albums shorter than this length will be filtered out."""
         return self.__album_length_threshold_min
-    
 
-    def get_all_genres(self) -> set:
-        """Get the list of all genres."""
-        return self.__genre_playlists_by_name.keys()
+
+    def __get_genre_names_snapshot(self) -> tuple:
+        """Get the cached tuple of genre names, rebuilding it if the playlists store has changed."""
+        if self.__genre_names_cache is None:
+            self.__genre_names_cache = tuple(self.__get_genre_playlists())
+        return self.__genre_names_cache
+
+
+    def get_all_genres(self) -> tuple:
+        """Get all genre names."""
+        return self.__get_genre_names_snapshot()
 
 
     def get_client_id(self) -> str:
@@ -81,53 +145,72 @@ class SparseConfigs:
     
 
     def get_genre_playlists_names(self) -> list:
-        """Get the mapping from genre name to Spotify playlist ID. Returns None if the key wasn't found."""
-        return list(self.__genre_playlists_by_name.keys())
+        """Get the list of genre names. Returns a fresh list since some callers append to the result."""
+        return list(self.__get_genre_names_snapshot())
     
     
     def get_genre_playlist_by_name(self, name: str) -> str:
         """Get the mapping from genre name to Spotify playlist ID. Returns None if the key wasn't found."""
-        return utilities.get(data=self.__genre_playlists_by_name, key=name)
+        return self.__get_genre_playlists().get(name)
     
 
     def get_genred_album_keys(self) -> set:
         """Get a set of album keys for all albums whose genres have been determined."""
-        return self.__ranked_album_genres_by_album_key.keys()
+        return self.__get_ranked_album_genres().keys()
     
     
     def get_ranked_album_genres_by_album_key(self, album_key: str) -> dict:
         """Get a comma-separated list of genres for the matching album. Returns None if the key wasn't found."""
-        return utilities.get(data=self.__ranked_album_genres_by_album_key, key=album_key)
+        return self.__get_ranked_album_genres().get(album_key)
     
     
     def update_genre_data(self, album_key: str, genre_data: dict) -> None:
-        """Update the genres for a ranked album in memory and on disk."""
-
-        # Add to configs in memory.
-        self.__ranked_album_genres_by_album_key[album_key] = genre_data
-        # Add to configs on disk.
-        with open(self.__ranked_album_genres_file_path, 'w') as json_file:
-            json.dump(self.__ranked_album_genres_by_album_key, json_file, indent=4)
+        """Update the genres for a ranked album in memory. Persisted to disk on the next flush_all()."""
+        ranked_album_genres = self.__get_ranked_album_genres()
+        if ranked_album_genres.get(album_key) == genre_data:
+            # Nothing changed; don't mark the store dirty or a no-op re-run would still rewrite the file.
+            return
+        ranked_album_genres[album_key] = genre_data
+        self.__genres_dirty = True
 
 
     def update_overrides(self, album_key: str, override_data: dict) -> None:
-        """Update the album overrides in memory and on disk."""
+        """Update the album overrides in memory. Persisted to disk on the next flush_all()."""
+        ranker_overrides = self.__get_ranker_overrides()
+        if ranker_overrides.get(album_key) == override_data:
+            return
+        ranker_overrides[album_key] = override_data
+        self.__overrides_dirty = True
 
-        # Add to configs in memory.
-        self.__ranker_overrides[album_key] = override_data
-        # Add to configs on disk.
-        with open(self.__ranker_overrides_file_path, 'w') as json_file:
-            json.dump(self.__ranker_overrides, json_file, indent=4)
- 
 
     def update_playlist_data(self, genre: str, playlist_id: str):
-        """Update the genre playlists in memory and on disk."""
-
-        # Add to configs in memory.
-        self.__genre_playlists_by_name[genre] = playlist_id
-        # Add to configs on disk.
-        with open(self.__genre_playlists_file_path, 'w') as json_file:
-            json.dump(self.__genre_playlists_by_name, json_file, indent=4)
+        """Update the genre playlists in memory. Persisted to disk on the next flush_all()."""
+        genre_playlists = self.__get_genre_playlists()
+        if genre_playlists.get(genre) == playlist_id:
+            return
+        genre_playlists[genre] = playlist_id
+        self.__playlists_dirty = True
+        # The name snapshot is stale now; rebuild it on next access.
+        self.__genre_names_cache = None
+
+
+    def flush_all(self) -> None:
+        """Write every mutable config store that has changed since the last flush to disk."""
+
+        if self.__genres_dirty:
+            utilities.atomic_write_json(
+                file_path=self.__ranked_album_genres_file_path,
+                data=self.__ranked_album_genres_by_album_key
+            )
+            self.__genres_dirty = False
+
+        if self.__overrides_dirty:
+            utilities.atomic_write_json(file_path=self.__ranker_overrides_file_path, data=self.__ranker_overrides)
+            self.__overrides_dirty = False
+
+        if self.__playlists_dirty:
+            utilities.atomic_write_json(file_path=self.__genre_playlists_file_path, data=self.__genre_playlists_by_name)
+            self.__playlists_dirty = False
 
     
     def get_ranker_output_path(self) -> str:
@@ -137,7 +220,12 @@ class SparseConfigs:
 
     def get_ranker_override_by_album_key(self, album_key: str) -> dict:
         """Get album override values for the matching album. Returns None if the key wasn't found."""
-        return utilities.get(data=self.__ranker_overrides, key=album_key)
+        return self.__get_ranker_overrides().get(album_key)
+
+
+    def get_all_ranker_overrides(self) -> dict:
+        """Get the full mapping from album key to override data, so callers can probe many keys with plain dict gets."""
+        return self.__get_ranker_overrides()
 
 
     def get_tier_1_playlist_id(self) -> str:
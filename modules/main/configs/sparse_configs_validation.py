@@ -1,4 +1,5 @@
 import modules.main.util.constants as C
+import operator
 
 
 class SparseConfigsException(Exception):
@@ -6,11 +7,39 @@ class SparseConfigsException(Exception):
     pass
 
 
+# The expected key, type and suffix for every config entry. This is static data, so build it once at import time
+# instead of on every validate() call; a tuple of tuples is the cheapest sequence to iterate.
+_KEYS_TYPES_AND_SUFFIXES = (
+    (C.ALBUM_LENGTH_THRESHOLD_MIN_KEY, int, None),
+    (C.CLIENT_ID_KEY, str, None),
+    (C.CLIENT_SECRET_KEY, str, None),
+    (C.GENRE_PLAYLISTS_FILE_PATH_KEY, str, C.JSON_EXTENSION),
+    (C.RANKED_ALBUM_GENRES_FILE_PATH_KEY, str, C.JSON_EXTENSION),
+    (C.RANKER_OVERRIDE_FILE_PATH_KEY, str, C.JSON_EXTENSION),
+    (C.RANKER_OUTPUT_FILE_PATH_KEY, str, C.CSV_EXTENSION),
+    (C.TIER_1_PLAYLIST_ID_KEY, str, None),
+    (C.TIER_2_PLAYLIST_ID_KEY, str, None),
+    (C.TIER_3_PLAYLIST_ID_KEY, str, None),
+    (C.TIER_3_YEARLY_THRESHOLD_KEY, int, None),
+    (C.USER_KEY, str, None)
+)
+
+# One itemgetter over every required key: probing for all of them is a single C-level call on the happy path.
+_REQUIRED_KEYS = tuple(key for key, _, _ in _KEYS_TYPES_AND_SUFFIXES)
+_REQUIRED_GETTER = operator.itemgetter(*_REQUIRED_KEYS)
+
+# Config entries that must hold a positive integer, mapped to the name used in the issue message.
+_POSITIVE_KEYS_AND_NAMES = {
+    C.TIER_3_YEARLY_THRESHOLD_KEY: "Tier 3 yearly threshold",
+    C.ALBUM_LENGTH_THRESHOLD_MIN_KEY: "Album length threshold"
+}
+
+
 def raise_exception_if_issues_exist(issues: list, configs_file_path: str) -> None:
     """Throw an exception if there are issues with the config file."""
     if issues:
-        issuesString = f"The following issues were found with the Album Ranker config file ({configs_file_path}):"
-        for issue in issues: issuesString += f"\n\t{issue}"
+        issuesString = f"The following issues were found with the Album Ranker config file ({configs_file_path}):\n\t" + \
+            "\n\t".join(issues)
         raise SparseConfigsException(issuesString)
     
 
@@ -34,11 +63,16 @@ def check_key(
     """
     if key not in configs:
         issues.append(f"No `{key}` detected in Sparse configs.")
-    elif not isinstance(configs[key], expected_type):
+        return
+
+    value = configs[key]
+    if not isinstance(value, expected_type):
         issues.append(f"`{key}` in Sparse configs must be a `{expected_type.__name__}`.")
-    elif isinstance(configs[key], str) and not configs[key]:
+    elif isinstance(value, str) and not value:
         issues.append(f"`{key}` in Sparse configs must not be empty.")
-    elif expected_suffix and not f"{configs[key]}".lower().endswith(expected_suffix):
+    elif expected_suffix and value[-len(expected_suffix):].casefold() != expected_suffix:
+        # Suffix keys are strings by this point (the type check above short-circuits otherwise), so compare just the
+        # case-folded tail instead of stringifying and lower-casing the whole path.
         issues.append(f"`{key}` in Sparse configs did not end with expected suffix `{expected_suffix}`.")
 
 
@@ -53,35 +87,31 @@ def validate(configs: dict, configs_file_path: str) -> None:
     
     issues = []
 
-    # Check the config dict to make sure the expected keys exist, have the expected type and have the expected suffix.
-    keys_types_and_suffixes = [
-        (C.ALBUM_LENGTH_THRESHOLD_MIN_KEY, int, None),
-        (C.CLIENT_ID_KEY, str, None),
-        (C.CLIENT_SECRET_KEY, str, None),
-        (C.GENRE_PLAYLISTS_FILE_PATH_KEY, str, C.JSON_EXTENSION),
-        (C.RANKED_ALBUM_GENRES_FILE_PATH_KEY, str, C.JSON_EXTENSION),
-        (C.RANKER_OVERRIDE_FILE_PATH_KEY, str, C.JSON_EXTENSION),
-        (C.RANKER_OUTPUT_FILE_PATH_KEY, str, C.CSV_EXTENSION),
-        (C.TIER_1_PLAYLIST_ID_KEY, str, None),
-        (C.TIER_2_PLAYLIST_ID_KEY, str, None),
-        (C.TIER_3_PLAYLIST_ID_KEY, str, None),
-        (C.TIER_3_YEARLY_THRESHOLD_KEY, int, None),
-        (C.USER_KEY, str, None)
-    ]
-    
-    for key, expected_type, expected_suffix in keys_types_and_suffixes:
+    # Probe for every required key at once. When all keys are present (the overwhelmingly common case) this is one
+    # C-level call; only when something is missing do we fall back to per-key probes so every missing key is reported.
+    missing = ()
+    try:
+        _REQUIRED_GETTER(configs)
+    except KeyError:
+        missing = frozenset(key for key in _REQUIRED_KEYS if key not in configs)
+        for key in _REQUIRED_KEYS:
+            if key in missing:
+                issues.append(f"No `{key}` detected in Sparse configs.")
+
+    # Check the config dict in a single pass: every key gets its existence/type/suffix check, and the threshold keys
+    # additionally get their positivity check inline when they hold a valid int. One walk over the configs, one raise.
+    for key, expected_type, expected_suffix in _KEYS_TYPES_AND_SUFFIXES:
+        if key in missing:
+            continue
         check_key(
-            configs=configs, 
-            key=key, 
-            expected_type=expected_type, 
+            configs=configs,
+            key=key,
+            expected_type=expected_type,
             expected_suffix=expected_suffix,
             issues=issues
         )
-    raise_exception_if_issues_exist(issues=issues, configs_file_path=configs_file_path)
-
-    # Extra validation:
-    if (configs[C.TIER_3_YEARLY_THRESHOLD_KEY] <= 0):
-        issues.append("Tier 3 yearly threshold must be greater than 0. Please check configs ({configs_file_path}).")
-    if (configs[C.ALBUM_LENGTH_THRESHOLD_MIN_KEY] <= 0):
-        issues.append("Album length threshold must be greater than 0. Please check configs ({configs_file_path}).")
+        if key in _POSITIVE_KEYS_AND_NAMES and isinstance(configs.get(key), int) and configs[key] <= 0:
+            issues.append(
+                f"{_POSITIVE_KEYS_AND_NAMES[key]} must be greater than 0. Please check configs ({configs_file_path})."
+            )
     raise_exception_if_issues_exist(issues=issues, configs_file_path=configs_file_path)
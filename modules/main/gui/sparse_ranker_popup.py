@@ -1,9 +1,10 @@
 from modules.main.ranking.album_ranker import AlbumRanker
+from concurrent.futures import ThreadPoolExecutor
 import PySimpleGUI as sg
 from modules.main.configs.sparse_configs import SparseConfigs
 from modules.main.spotify.spotify_client import SpotifyClient
 import modules.main.util.constants as constants
-import time
+import logging
 
 
 class SparseRankerPopup:
@@ -25,10 +26,25 @@ class SparseRankerPopup:
             font=constants.POPUP_FONT
         )
 
-        # Give the pop-up time to close before starting the ranker run.
-        time.sleep(0.5)
-        self.__ranker.run()
-        
+        # Run the ranker on a worker thread so the GUI thread stays responsive while it fetches playlists and writes
+        # results. A small progress window polls the future instead of blocking on it.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self.__ranker.run)
+
+            progress_window = sg.Window(
+                title=constants.NOTICE_TAG,
+                layout=[[sg.Text("SPARSE is ranking your music...", font=constants.POPUP_FONT)]],
+                finalize=True
+            )
+            while not future.done():
+                event, _ = progress_window.read(timeout=200)
+                if event == sg.WIN_CLOSED:
+                    break
+            progress_window.close()
+
+            # Surface any exception the ranker run raised.
+            future.result()
+
         sg.popup_no_titlebar(
             "SPARSE ranking is complete. New results will now appear in the sorter window.",
             title=constants.NOTICE_TAG,
@@ -37,6 +53,7 @@ class SparseRankerPopup:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(filename='./log/album_ranker.log', level=logging.INFO)
     configs = SparseConfigs()
     client = SpotifyClient(configs=configs)
     ranker = AlbumRanker(configs=configs, client=client)
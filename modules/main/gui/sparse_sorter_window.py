@@ -1,6 +1,7 @@
 from modules.main.sorting.album_sorter import AlbumSorter
 import modules.main.util.constants as C
 import PySimpleGUI as sg
+import threading
 from modules.main.configs.sparse_configs import SparseConfigs
 from modules.main.spotify.spotify_client import SpotifyClient
 import modules.main.util.utilities as utilities
@@ -8,47 +9,83 @@ import modules.main.util.utilities as utilities
 class SparseSorterWindow:
     """The main window for the Sparse Sorter application."""
 
-    # The currently selected ungenred album. None until refreshed.
-    __selected_ungenred_album = None 
+    # Flush batched config writes to disk after this many genre confirmations. Confirmations only mutate the in-memory
+    # stores, so a long tagging session costs one file rewrite per batch instead of one per album.
+    __FLUSH_EVERY = 20
+
+    # Fixed attribute layout, in mangled form because of the double-underscore privates: drops the per-instance
+    # __dict__ and speeds up the attribute reads in the event loop.
+    __slots__ = (
+        "_SparseSorterWindow__album_list_tab",
+        "_SparseSorterWindow__album_list_token",
+        "_SparseSorterWindow__album_page",
+        "_SparseSorterWindow__confirm_dialog",
+        "_SparseSorterWindow__confirms_since_flush",
+        "_SparseSorterWindow__entry_tab",
+        "_SparseSorterWindow__genre_keywords",
+        "_SparseSorterWindow__known_genre_keywords",
+        "_SparseSorterWindow__layout",
+        "_SparseSorterWindow__selected_ungenred_album",
+        "_SparseSorterWindow__sorter",
+        "_SparseSorterWindow__tier_3_list_token",
+        "_SparseSorterWindow__tier_3_track_list_view_tab",
+        "_SparseSorterWindow__window"
+    )
 
     def __refresh_selected_album(self) -> None:
         """Refresh the selected ungenred album."""
-        self.__selected_ungenred_album = self.__sorter.get_next_album_with_unknown_genre()
-        if (self.__selected_ungenred_album != None):
-            if (len(self.__selected_ungenred_album) == 2):
-                album_key = utilities.get_album_key(
-                    artist_names=self.__selected_ungenred_album[0], 
-                    album_name=self.__selected_ungenred_album[1]
-                )
-                self.__window[C.UNKNOWN_ALBUM_KEY].update(album_key)
-            else:
-                self.__window[C.UNKNOWN_ALBUM_KEY].update(C.END_OF_LIST)
+        album = self.__sorter.get_next_album_with_unknown_genre()
+        self.__selected_ungenred_album = album
+        if album is not None and len(album) == 2:
+            artist_names, album_name = album
+            label = utilities.get_album_key(artist_names=artist_names, album_name=album_name)
         else:
-            self.__window[C.UNKNOWN_ALBUM_KEY].update(C.END_OF_LIST)
+            label = C.END_OF_LIST
+        self.__window[C.UNKNOWN_ALBUM_KEY].update(label)
 
 
     def __init__(self, sorter: AlbumSorter):
         """Initialize the Sparse Sorter window."""
         self.__sorter = sorter
 
+        # The currently selected ungenred album. None until refreshed.
+        self.__selected_ungenred_album = None
+
+        # The reusable similar-genre confirmation dialog. Built lazily on first use and hidden between uses, since
+        # window creation is the most expensive PySimpleGUI operation and the confirm-genre flow can need it many times.
+        self.__confirm_dialog = None
+
+        # Fetch the option lists once and share them between tabs; each getter scans the full ranker output.
+        years = self.__sorter.get_years()
+        genre_keywords = self.__sorter.get_genre_keywords()
+
+        # Keep the genre options around so confirmed genres can be added to the picker in place, without rebuilding
+        # the window or re-scanning the genre index.
+        self.__genre_keywords = genre_keywords
+        self.__known_genre_keywords = set(genre_keywords)
+
         # Album list tab:
         self.__album_list_tab = [
             [sg.Titlebar(C.APPLICATION_TITLE)],
             [sg.Text(C.YEAR_TAG)],
-            [sg.OptionMenu(self.__sorter.get_years(), default_value=C.ALL_YEARS_NAME, key=C.ALBUM_LIST_YEAR_KEY)],
+            # Combo rather than OptionMenu: the ttk combobox renders its popup lazily, so the window opens in
+            # constant time instead of expanding every year/genre into a Tk menu item up front.
+            [sg.Combo(years, default_value=C.ALL_YEARS_NAME, key=C.ALBUM_LIST_YEAR_KEY, readonly=True)],
             [sg.Text(C.GENRE_TAG)],
-            [sg.OptionMenu(self.__sorter.get_genre_keywords(), default_value=C.ALL_GENRES_NAME, key=C.ALBUM_LIST_GENRE_KEY)],
-            [sg.Button(C.LIST_ALBUMS_TAG)],
-            [sg.Output(size=C.DEFAULT_DIMENSIONS, font=(C.DEFAULT_FONT), key=C.ALBUM_LIST_OUTPUT_KEY)]
+            [sg.Combo(genre_keywords, default_value=C.ALL_GENRES_NAME, key=C.ALBUM_LIST_GENRE_KEY, readonly=True)],
+            [sg.Button(C.LIST_ALBUMS_TAG), sg.Button(C.PREV_PAGE_TAG), sg.Button(C.NEXT_PAGE_TAG)],
+            # Multiline instead of Output: updates are one bulk text insert rather than a stdout redirect that
+            # rewrites the Tk widget per line, which matters when listing thousands of albums.
+            [sg.Multiline(size=C.DEFAULT_DIMENSIONS, font=(C.DEFAULT_FONT), key=C.ALBUM_LIST_OUTPUT_KEY, write_only=True, autoscroll=False, disabled=True)]
         ]
 
         # Tier 3 track list tab:
         self.__tier_3_track_list_view_tab = [
             [sg.Titlebar(C.APPLICATION_TITLE)],
             [sg.Text(C.YEAR_TAG)],
-            [sg.OptionMenu(self.__sorter.get_years(), default_value=C.ALL_YEARS_NAME, key=C.TIER_3_LIST_YEAR_KEY)],
+            [sg.Combo(years, default_value=C.ALL_YEARS_NAME, key=C.TIER_3_LIST_YEAR_KEY, readonly=True)],
             [sg.Button(C.LIST_TIER_3_TAG)],
-            [sg.Output(size=C.DEFAULT_DIMENSIONS, font=(C.DEFAULT_FONT), key=C.TIER_3_LIST_OUTPUT_KEY)]
+            [sg.Multiline(size=C.DEFAULT_DIMENSIONS, font=(C.DEFAULT_FONT), key=C.TIER_3_LIST_OUTPUT_KEY, write_only=True, autoscroll=False, disabled=True)]
         ]
 
         # Genre entry/Override entry tab:
@@ -79,118 +116,257 @@ class SparseSorterWindow:
         ]
 
 
-    def run(self) -> None:
-        """Run the album sorter window."""
+    def __handle_list_albums(self, values: dict) -> None:
+        """List the first page of album data using the year and genre filters."""
+        self.__album_page = 0
+        self.__render_album_page(values=values)
 
-        # Open window:
-        self.__window = sg.Window(title=C.APPLICATION_TITLE, layout=self.__layout, finalize=True)
 
-        # Refresh selected ungenred album:
-        self.__refresh_selected_album()
+    def __handle_prev_page(self, values: dict) -> None:
+        """Show the previous page of the album list."""
+        if self.__album_page > 0:
+            self.__album_page -= 1
+            self.__render_album_page(values=values)
 
-        # Event Loop to process events and get the values of the inputs:
-        while True:
-            event, values = self.__window.read()
 
-            # If tue user closes window:
-            if event == sg.WIN_CLOSED:
-                break
+    def __handle_next_page(self, values: dict) -> None:
+        """Show the next page of the album list."""
+        self.__album_page += 1
+        self.__render_album_page(values=values)
+
 
-            # If the user clicks the `list albums` button:
-            elif event == C.LIST_ALBUMS_TAG:
-
-                # List the album data using the year and genre filters:
-                try:
-                    year_value = values[C.ALBUM_LIST_YEAR_KEY]
-                    if year_value == C.ALL_YEARS_NAME:
-                        year = None
-                    else:
-                        year = int(year_value)
-                    genre_value = values[C.ALBUM_LIST_GENRE_KEY]
-                    if genre_value == C.ALL_GENRES_NAME:
-                        genre = None
-                    else:
-                        genre = genre_value
-
-                # Display a helpful error message if the year was invalid:
-                except ValueError:
-                    self.__window[C.ALBUM_LIST_OUTPUT_KEY].update(C.YEAR_ERROR_MESSAGE)
-
-                album_list = self.__sorter.get_album_list(year=year, genre=genre)
-                self.__window[C.ALBUM_LIST_OUTPUT_KEY].update(album_list)
-                
-            # If the user clicks the `list tier 3 tracks` button:
-            elif event == C.LIST_TIER_3_TAG:
-
-                # List the tier 3 tracks for the specified year:
-                try:
-                    year_value = values[C.TIER_3_LIST_YEAR_KEY]
-                    if year_value == C.ALL_YEARS_NAME:
-                        year = None
-                    else:
-                        year = int(year_value)
-                    tier_3_list = self.__sorter.get_tier_3_tracks(year)
-                    self.__window[C.TIER_3_LIST_OUTPUT_KEY].update(tier_3_list)
-
-                # Display a helpful error message if the year was invalid.
-                except ValueError:
-                    self.__window[C.TIER_3_LIST_OUTPUT_KEY].update(C.YEAR_ERROR_MESSAGE)
-
-            # If the user clicks the `confirm genre` button:
-            elif event == C.CONFIRM_GENRE_TAG:
-
-                # Save the current un-genred album to memory + disk and add the tier three tracks to genre-specific playlists 
-                # based on the comma-separated list of genres currently entered into the genre input field.
-                genre_input = values[C.GENRE_INPUT_KEY]
-                if (self.__selected_ungenred_album != None) & (genre_input != ""):
-                    if len(self.__selected_ungenred_album) == 2:
-
-                        cleaned_genres = utilities.get_clean_genres_list(genres_string=genre_input)
-                        validated_genres = []
-                        for cleaned_genre in cleaned_genres:
-                            validated_genres.append(cleaned_genre)
-                            for potential_match in self.__sorter.get_similar_genres(genre=cleaned_genre):
-                                sg.set_options(font=C.DEFAULT_FONT)
-                                choice, _ = sg.Window(
-                                    "Which Genre?", 
-                                    [[sg.T(f"You typed `{cleaned_genre}`, but we found that `{potential_match}` already exists in the database. Did you actually mean `{potential_match}`?")], [sg.Yes(s=10), sg.No(s=10)]], 
-                                    disable_close=True
-                                ).read(close=True) 
-
-                                if choice == "Yes":
-                                    validated_genres.pop()
-                                    validated_genres.append(potential_match)
-                                    break
-
-                        self.__sorter.assign_genres_to_album(
-                            artist_names=self.__selected_ungenred_album[0],
-                            album_name=self.__selected_ungenred_album[1],
-                            genres_list=validated_genres
+    def __render_album_page(self, values: dict) -> None:
+        """Render the current page of album data using the year and genre filters."""
+        try:
+            year_value = values[C.ALBUM_LIST_YEAR_KEY]
+            if year_value == C.ALL_YEARS_NAME:
+                year = None
+            else:
+                year = int(year_value)
+            genre_value = values[C.ALBUM_LIST_GENRE_KEY]
+            if genre_value == C.ALL_GENRES_NAME:
+                genre = None
+            else:
+                genre = genre_value
+
+        # Display a helpful error message if the year was invalid, and skip the fetch entirely:
+        except ValueError:
+            self.__window[C.ALBUM_LIST_OUTPUT_KEY].update(C.YEAR_ERROR_MESSAGE)
+            return
+
+        # Fetch and format on a worker thread; the result comes back through the event loop so the GUI thread never
+        # blocks on the CSV re-read and dataframe work. The token lets rapid repeat clicks coalesce: only the
+        # newest request's result is rendered.
+        self.__album_list_token += 1
+        threading.Thread(
+            target=self.__list_albums_worker,
+            args=(self.__album_list_token, year, genre, self.__album_page * C.ALBUM_LIST_PAGE_SIZE),
+            daemon=True
+        ).start()
+
+
+    def __list_albums_worker(self, token: int, year: int, genre: str, offset: int) -> None:
+        """Fetch a page of album data and post it back to the event loop, tagged with its request token."""
+        album_list = self.__sorter.get_album_list(year=year, genre=genre, limit=C.ALBUM_LIST_PAGE_SIZE, offset=offset)
+        self.__window.write_event_value(C.ALBUMS_READY_EVENT, (token, album_list))
+
+
+    def __handle_albums_ready(self, values: dict) -> None:
+        """Show the album list fetched by the worker thread, unless a newer request has superseded it."""
+        token, album_list = values[C.ALBUMS_READY_EVENT]
+        if token == self.__album_list_token:
+            self.__window[C.ALBUM_LIST_OUTPUT_KEY].update(album_list)
+
+
+    def __handle_list_tier_3(self, values: dict) -> None:
+        """List the tier 3 tracks for the specified year."""
+        try:
+            year_value = values[C.TIER_3_LIST_YEAR_KEY]
+            if year_value == C.ALL_YEARS_NAME:
+                year = None
+            else:
+                year = int(year_value)
+            # The tier 3 lookup hits Spotify for track details, so run it off the GUI thread too.
+            self.__tier_3_list_token += 1
+            threading.Thread(target=self.__list_tier_3_worker, args=(self.__tier_3_list_token, year), daemon=True).start()
+
+        # Display a helpful error message if the year was invalid.
+        except ValueError:
+            self.__window[C.TIER_3_LIST_OUTPUT_KEY].update(C.YEAR_ERROR_MESSAGE)
+
+
+    def __list_tier_3_worker(self, token: int, year: int) -> None:
+        """Fetch the tier 3 track list and post it back to the event loop, tagged with its request token."""
+        tier_3_list = self.__sorter.get_tier_3_tracks(year)
+        self.__window.write_event_value(C.TIER_3_READY_EVENT, (token, tier_3_list))
+
+
+    def __handle_tier_3_ready(self, values: dict) -> None:
+        """Show the tier 3 track list fetched by the worker thread, unless a newer request has superseded it."""
+        token, tier_3_list = values[C.TIER_3_READY_EVENT]
+        if token == self.__tier_3_list_token:
+            self.__window[C.TIER_3_LIST_OUTPUT_KEY].update(tier_3_list)
+
+
+    def __ask_about_similar_genre(self, cleaned_genre: str, potential_match: str) -> str:
+        """Ask the user whether they meant an existing similar genre. Returns the clicked button's text."""
+
+        if self.__confirm_dialog is None:
+            sg.set_options(font=C.DEFAULT_FONT)
+            self.__confirm_dialog = sg.Window(
+                C.CONFIRM_DIALOG_TITLE,
+                [[sg.Text("", key=C.CONFIRM_DIALOG_QUESTION_KEY)], [sg.Yes(s=10), sg.No(s=10)]],
+                disable_close=True,
+                finalize=True
+            )
+            self.__confirm_dialog.hide()
+
+        self.__confirm_dialog[C.CONFIRM_DIALOG_QUESTION_KEY].update(
+            f"You typed `{cleaned_genre}`, but we found that `{potential_match}` already exists in the database. Did you actually mean `{potential_match}`?"
+        )
+        self.__confirm_dialog.un_hide()
+        choice, _ = self.__confirm_dialog.read()
+        self.__confirm_dialog.hide()
+        return choice
+
+
+    def __handle_confirm_genre(self, values: dict) -> None:
+        """
+        Save the current un-genred album to memory and add the tier three tracks to genre-specific playlists based on
+        the comma-separated list of genres currently entered into the genre input field.
+        """
+        genre_input = values[C.GENRE_INPUT_KEY]
+        if self.__selected_ungenred_album is not None and genre_input:
+            if len(self.__selected_ungenred_album) == 2:
+                artist_names, album_name = self.__selected_ungenred_album
+
+                cleaned_genres = utilities.get_clean_genres_list(genres_string=genre_input)
+
+                # Find the similar genres for every entered genre in one pass over the genre index.
+                similar_genres_by_genre = self.__sorter.get_similar_genres_bulk(genres=cleaned_genres)
+
+                validated_genres = []
+                for cleaned_genre in cleaned_genres:
+                    validated_genres.append(cleaned_genre)
+                    for potential_match in similar_genres_by_genre[cleaned_genre]:
+                        choice = self.__ask_about_similar_genre(
+                            cleaned_genre=cleaned_genre,
+                            potential_match=potential_match
                         )
-                        self.__refresh_selected_album()
 
-            # If the user clicks the `confirm override` button:
-            elif event == C.CONFIRM_OVERRIDE_TAG:
+                        if choice == "Yes":
+                            validated_genres.pop()
+                            validated_genres.append(potential_match)
+                            break
+
+                self.__sorter.assign_genres_to_album(
+                    artist_names=artist_names,
+                    album_name=album_name,
+                    genres_list=validated_genres
+                )
+                self.__refresh_selected_album()
+
+                # If any confirmed genre is new, add it to the genre picker in place instead of rebuilding the
+                # window or re-walking the genre index.
+                new_genres = [genre for genre in validated_genres if genre not in self.__known_genre_keywords]
+                if new_genres:
+                    self.__known_genre_keywords.update(new_genres)
+                    self.__genre_keywords = [C.ALL_GENRES_NAME] + sorted(self.__genre_keywords[1:] + new_genres)
+                    self.__window[C.ALBUM_LIST_GENRE_KEY].update(
+                        values=self.__genre_keywords,
+                        value=values[C.ALBUM_LIST_GENRE_KEY]
+                    )
+
+                # Periodically flush the batched writes so a crash can't lose a whole session's worth of work.
+                self.__confirms_since_flush += 1
+                if self.__confirms_since_flush >= self.__FLUSH_EVERY:
+                    self.__sorter.flush_configs()
+                    self.__confirms_since_flush = 0
+
+
+    def __handle_confirm_override(self, values: dict) -> None:
+        """
+        Make an entry in memory to override the album currently entered into the artist names & album name input
+        fields with the data from the album entered into the override uri input field.
+        """
+        artists_input = values[C.ALBUM_ARTISTS_INPUT_KEY]
+        name_input = values[C.ALBUM_NAME_INPUT_KEY]
+        override_uri = values[C.OVERRIDE_URI_INPUT_KEY]
+
+        # Only create the override if all inputs are valid.
+        if artists_input and name_input and override_uri:
+
+            album_key = utilities.get_album_key(artist_names=artists_input, album_name=name_input)
+            override = self.__sorter.add_override(album_key=album_key, override_uri=override_uri)
+
+            if override:
+                sg.Popup(f"{C.OVERRIDE_ADDED_MESSAGE}\n\n{album_key}:\n{override}")
+            else:
+                sg.Popup(C.OVERRIDE_NOT_ADDED_MESSAGE)
+
 
-                # Make an entry in memory and disk to override the album currently entered into the artist names & album name 
-                # input fields with the data from the album entered into the override uri input field.
-                artists_input = values[C.ALBUM_ARTISTS_INPUT_KEY]
-                name_input = values[C.ALBUM_NAME_INPUT_KEY]
-                override_uri = values[C.OVERRIDE_URI_INPUT_KEY]
+    def run(self, ready_event=None) -> None:
+        """
+        Run the album sorter window.
 
-                # Only create the override if all inputs are valid.
-                if artists_input and name_input and override_uri:
+        Args:
+            ready_event (multiprocessing.Event): Optional event set as soon as the window is on screen, so the
+                launcher can sequence other windows against it instead of sleeping for a fixed delay.
+        """
 
-                    override = self.__sorter.add_override(album_key=album_key, override_uri=override_uri)
+        # Open window:
+        self.__window = sg.Window(title=C.APPLICATION_TITLE, layout=self.__layout, finalize=True)
+        if ready_event is not None:
+            ready_event.set()
 
-                    if override:
-                        album_key = utilities.get_album_key(artists_input, name_input)
-                        sg.Popup(f"{C.OVERRIDE_ADDED_MESSAGE}\n\n{album_key}:\n{override}")
-                    else:
-                        sg.Popup(C.OVERRIDE_NOT_ADDED_MESSAGE)
+        # Refresh selected ungenred album:
+        self.__refresh_selected_album()
+
+        # Count of genre confirmations since the last flush to disk.
+        self.__confirms_since_flush = 0
+
+        # Current page of the album list.
+        self.__album_page = 0
+
+        # Monotonically increasing request tokens for the two list fetches. Results tagged with a stale token are
+        # dropped, so mashing a list button costs one render instead of one per click.
+        self.__album_list_token = 0
+        self.__tier_3_list_token = 0
+
+        # Dispatch table from event to handler. Built once so the event loop does a single hash lookup per event
+        # instead of walking an if/elif chain, and new tabs only need a new entry here.
+        handlers = {
+            C.LIST_ALBUMS_TAG: self.__handle_list_albums,
+            C.PREV_PAGE_TAG: self.__handle_prev_page,
+            C.NEXT_PAGE_TAG: self.__handle_next_page,
+            C.LIST_TIER_3_TAG: self.__handle_list_tier_3,
+            C.ALBUMS_READY_EVENT: self.__handle_albums_ready,
+            C.TIER_3_READY_EVENT: self.__handle_tier_3_ready,
+            C.CONFIRM_GENRE_TAG: self.__handle_confirm_genre,
+            C.CONFIRM_OVERRIDE_TAG: self.__handle_confirm_override
+        }
+
+        # Event Loop to process events and get the values of the inputs. Reads poll with a timeout instead of
+        # blocking the Tk mainloop, leaving room for background work (e.g. the ranker thread) between events:
+        while True:
+            event, values = self.__window.read(timeout=100, timeout_key=sg.TIMEOUT_EVENT)
+
+            # Nothing happened during this poll interval:
+            if event == sg.TIMEOUT_EVENT:
+                continue
+
+            # If the user closes the window:
+            if event == sg.WIN_CLOSED:
+                break
 
+            handler = handlers.get(event)
+            if handler:
+                handler(values=values)
 
-        # Close window when loop ends:
+        # Flush pending config changes to disk, then close the windows:
+        self.__sorter.flush_configs()
+        if self.__confirm_dialog is not None:
+            self.__confirm_dialog.close()
         self.__window.close()
 
 
@@ -1,6 +1,11 @@
-import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
+import json
 import logging
+import sys
+import threading
+import time
 from dataclasses import dataclass
+import pandas as pd
 import modules.main.util.constants as C
 from modules.main.configs.sparse_configs import SparseConfigs
 import modules.main.spotify.spotify_utilities as spotify_utilities
@@ -8,14 +13,15 @@ from modules.main.spotify.spotify_client import SpotifyClient
 import modules.main.util.utilities as utilities
 
 
-# Set up logging.
-logging.basicConfig(filename='./log/album_ranker.log', level=logging.INFO)
+# Module-level logger. Handlers are configured by the entrypoints so that importing this module (e.g. from tests)
+# doesn't write to disk.
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class Album:
     """
-    A class representing an Album Ranker album.
+    A class representing an Album Ranker album. Slotted so that the thousands of instances held in memory during a run
+    skip the per-instance dict and attribute access in the hot track-saving path is a fixed slot read.
 
     Attributes:
         artists (str): The comma-separated list of album artists.
@@ -23,10 +29,17 @@ class Album:
         highest_possible_score (float): The highest score this album can achieve given the number and length of tracks.
         year (int): The year the album was released.
         duration_ms (int): The length of the album in milliseconds.
-        album_track_names (set): The set of track names for all tracks in the album.
+        album_track_names (frozenset): The set of track names for all tracks in the album. Frozen because it is never
+            mutated after construction, with the names interned so repeated titles share one string object across
+            albums and membership probes usually resolve on an identity compare.
         playlist_placements (dict): The mapping from tier playlist placement key to track score the tracks in this album. 
-            Tier placement key formatted as: "TRACK_NAME_TIER"
+            Tier placement key formatted as: (TRACK_NAME, TIER)
         best_tracks (set): The set of tier 3 tracks in this album.
+        total_score (float): The running sum of the scores in playlist_placements, maintained as tracks are saved so no
+            summing pass is needed at output time.
+        signature (int): A 64-bit hash signature of album_track_names. If any bit of one album's signature is missing
+            from another's, the first album cannot be a track subset of the second, so most non-subset pairs are ruled
+            out with a couple of integer ops instead of a full set comparison.
     """
 
     artists: str
@@ -34,9 +47,11 @@ class Album:
     highest_possible_score: float
     year: int
     duration_ms: int
-    album_track_names: set
+    album_track_names: frozenset
     playlist_placements: dict
     best_tracks: set
+    total_score: float = 0.0
+    signature: int = 0
 
 
 class AlbumRanker:
@@ -59,14 +74,17 @@ class AlbumRanker:
 
         self.__configs = configs
         self.__client = client
+        # Serializes updates to the shared memory/tier_tracks dicts while the tiers are fetched concurrently.
+        self.__memory_lock = threading.Lock()
 
 
-    def __getAlbumKeyGivenArtists(self, artists: str, album: dict) -> str:
+    def __getAlbumKeyGivenArtists(self, artists: str, album: dict) -> tuple:
         """
-        Get the album key from a Spotify album. 
-            Formatted as: "{COMMA_SEPARATED_ALBUM_ARTISTS} - {ALBUM_TITLE}")
+        Get the album key from a Spotify album. A tuple of two already-built strings is cheaper to build and hash per
+        track than a freshly formatted string.
+            Formatted as: (COMMA_SEPARATED_ALBUM_ARTISTS, ALBUM_TITLE)
         """
-        return utilities.get_album_key(artists, album[C.NAME_KEY])
+        return (artists, album[C.NAME_KEY])
 
 
     def __getEmptyAlbum(self, track: dict, artist_names: str) -> Album:
@@ -90,8 +108,17 @@ class AlbumRanker:
         album_tracks = spotify_utilities.get_tracks(spotify_album=enriched_album)
         highest_possible_score = spotify_utilities.get_album_highest_possible_score(spotify_album_tracks=album_tracks)
         year = utilities.extract_year_from_date(date=album[C.RELEASE_DATE_KEY])
-        tracks = spotify_utilities.get_track_names(spotify_album_tracks=album_tracks)
-        
+        # `album_track_names` is a frozenset so that subset checks during consolidation are single C-level calls.
+        # Interning the names dedupes repeated titles across albums and editions, which both shrinks memory and lets
+        # most membership probes during subset checks short-circuit on a pointer compare.
+        tracks = frozenset(sys.intern(name) for name in spotify_utilities.get_track_names(spotify_album_tracks=album_tracks))
+
+        # Fold each track name into one bit of a 64-bit signature used to prefilter subset checks.
+        signature = 0
+        for track_name in tracks:
+            signature |= 1 << (hash(track_name) & 63)
+
+
         new_album = Album(
             artists=artist_names,
             name=album[C.NAME_KEY],
@@ -100,7 +127,8 @@ class AlbumRanker:
             duration_ms=0,
             album_track_names=tracks,
             playlist_placements={},
-            best_tracks=set()
+            best_tracks=set(),
+            signature=signature
         )
 
         return new_album
@@ -111,9 +139,9 @@ class AlbumRanker:
         tier: int,
         album_key: str, 
         duration_ms: int, 
-        memory: dict, 
-        tier_tracks: dict,
-        name: str, 
+        memory: dict,
+        tier_tracks: list,
+        name: str,
         score: float, 
         track_id: str
     ) -> None:
@@ -124,49 +152,54 @@ class AlbumRanker:
         Args:
             tier (int): The tier of the track we're adding to memory.
             album_key (str): The album key for the album we're adding this track to. 
-                (formatted as: "<COMMA_SEPARATED_ALBUM_ARTISTS> - <ALBUM_TITLE>")
+                (formatted as: (COMMA_SEPARATED_ALBUM_ARTISTS, ALBUM_TITLE))
             duration_ms (int): The duration of the track we're adding in milliseconds.
             memory (dict): The Albums encountered during this Album Ranker run, grouped by album key.
-            tier_tracks (dict): The Spotify track IDs for tracks encountered during this Album Ranker run, grouped by tier ID.
+            tier_tracks (list): The Spotify track ID sets for tracks encountered during this Album Ranker run, indexed
+                by tier.
             name (str): The name of the track.
             score (float): The score for the track.
             track_id (str): The Spotify track ID for the track.
         """
         
-        key = spotify_utilities.get_track_key(name=name, tier=tier)
-        memory[album_key].playlist_placements[key] = score
-        tier_key = spotify_utilities.get_tier_key(tier)
-
-        # Only add to best tracks and increase album duration if this track hasn't been counted yet.
-        if (tier_key not in tier_tracks[tier_key]):
-            tier_tracks[tier_key].add(track_id)
-            if (tier == 3):
-                # Only add to best tracks if tier 3.
-                memory[album_key].best_tracks.add(track_id)
-            elif (tier == 1):
-                # Only add duration if tier 1.
-                memory[album_key].duration_ms += duration_ms
-                # Do not recurse if tier 1.
-                return
-        
-        self.__addTieredTrackToMemory(
-            tier=tier-1,
-            album_key=album_key, 
-            duration_ms=duration_ms, 
-            memory=memory, 
-            tier_tracks=tier_tracks,
-            name=name, 
-            score=score, 
-            track_id=track_id
-        )
+        # Look up the album once; every tier below touches the same Album instance.
+        album = memory[album_key]
+
+        # Validate the name and tier once through get_track_key; the loop below only produces valid tiers, so the
+        # lower-tier keys are built inline in get_track_key's (TRACK_NAME, TIER) format without repeating the call.
+        spotify_utilities.get_track_key(name=name, tier=tier)
+
+        # Walk from this track's tier down to tier 1 in a flat loop rather than recursing, so each track only costs a
+        # single call frame.
+        for current_tier in range(tier, 0, -1):
+            key = (name, current_tier)
+
+            # Keep the running total in sync with the placement dict, accounting for overwrites of an existing key.
+            old_score = album.playlist_placements.get(key)
+            if old_score is None:
+                album.total_score += score
+            elif old_score != score:
+                album.total_score += score - old_score
+            album.playlist_placements[key] = score
+            tier_set = tier_tracks[current_tier]
+
+            # Only add to best tracks and increase album duration if this track hasn't been counted yet.
+            if (track_id not in tier_set):
+                tier_set.add(track_id)
+                if (current_tier == 3):
+                    # Only add to best tracks if tier 3.
+                    album.best_tracks.add(track_id)
+                elif (current_tier == 1):
+                    # Only add duration if tier 1.
+                    album.duration_ms += duration_ms
 
 
     def __saveTrackData(
         self, track: dict, 
         tier: int, 
-        album_key: str, 
-        memory: dict, 
-        tier_tracks: dict
+        album_key: str,
+        memory: dict,
+        tier_tracks: list
     ) -> None:
         """
         Save a track to the album it belongs to in memory and the tier it belongs to in tier_tracks.
@@ -175,9 +208,10 @@ class AlbumRanker:
             track (dict): The Spotify track we're adding to memory.
             tier (int): The tier this track belongs to.
             album_key (str): The album key for the album we're adding this track to. 
-                Formatted as: "{COMMA_SEPARATED_ALBUM_ARTISTS} - {ALBUM_TITLE}"
+                Formatted as: (COMMA_SEPARATED_ALBUM_ARTISTS, ALBUM_TITLE)
             memory (dict): The Albums encountered during this Album Ranker run, grouped by album key.
-            tier_tracks (dict): The Spotify track IDs for tracks encountered during this Album Ranker run, grouped by tier ID.
+            tier_tracks (list): The Spotify track ID sets for tracks encountered during this Album Ranker run, indexed
+                by tier.
         """
 
         name = spotify_utilities.get_track_name(spotify_track=track)
@@ -216,10 +250,10 @@ class AlbumRanker:
 
     def __executeTier(
         self, 
-        playlist_id: str, 
-        tier: int, 
-        memory: dict, 
-        tier_tracks: dict
+        playlist_id: str,
+        tier: int,
+        memory: dict,
+        tier_tracks: list
     ) -> None:
         """
         Collect scoring metadata on a tier playlist.
@@ -230,75 +264,98 @@ class AlbumRanker:
             memory (dict): The Albums encountered during this Album Ranker run, grouped by album key.
         """
 
-        # Only 100 tracks can be fetched from a playlist at a time, and the order of the fetched tracks cannot be guaranteed. 
-        # Therefore, we need to collect scoring metadata in batches. We also need to delete each batch from the Spotify playlist 
-        # after a batch has been recorded to prevent fetching duplicate tracks. 
+        # Only 100 tracks can be fetched from a playlist at a time, so scoring metadata is collected one page at a time
+        # via Spotify's pagination. Pagination is stable, so nothing needs to be deleted from the playlist between
+        # pages; all recorded tracks are removed in a single pass once the whole playlist has been read.
 
         logger.info(f"Running Tier {tier}...")
 
-        # Fetch the initial batch.
-        playlist_tracks = self.__client.getPlaylistItems(playlist_id=playlist_id)
-
-        # Run until there are no more tracks in the playlist.
-        while len(playlist_tracks) != 0:
-            tracks_to_delete = []
-
+        # A dict rather than a list so that duplicate playlist entries (Spotify allows them) only consume one removal
+        # slot each, while insertion order is preserved.
+        tracks_to_delete = {}
+
+        # Bind hot constants and methods to locals once so the per-track loop pays fast local loads instead of repeated
+        # attribute lookups.
+        TRACK_KEY = C.TRACK_KEY
+        ALBUM_KEY = C.ALBUM_KEY
+        URI_KEY = C.URI_KEY
+        get_artists = spotify_utilities.get_album_artist_names
+        get_album_key = self.__getAlbumKeyGivenArtists
+        get_empty_album = self.__getEmptyAlbum
+        save_track_data = self.__saveTrackData
+        memory_lock = self.__memory_lock
+        mark_for_deletion = tracks_to_delete.setdefault
+
+        # Collect scoring metadata one page at a time.
+        for playlist_tracks in self.__client.getPlaylistItemsPaged(playlist_id=playlist_id):
+
+            # First pass over the page: unwrap the tracks and collect the album IDs not yet in memory, then prefetch
+            # those albums in bulk (20 per request) so the per-track pass below never pays a full round-trip per album.
+            page_entries = []
+            unseen_album_ids = []
             for track in playlist_tracks:
+                unwrapped_track = track[TRACK_KEY]
+                album = unwrapped_track[ALBUM_KEY]
+                artists = get_artists(spotify_album=album)
+                album_key = get_album_key(artists=artists, album=album)
+                page_entries.append((unwrapped_track, artists, album_key))
+                if album_key not in memory:
+                    unseen_album_ids.append(album[URI_KEY])
+            if unseen_album_ids:
+                self.__client.getAlbums(album_ids=unseen_album_ids)
 
-                unwrapped_track = track[C.TRACK_KEY]
-                album = unwrapped_track[C.ALBUM_KEY]
-                artists = spotify_utilities.get_album_artist_names(spotify_album=album)
-                album_key = self.__getAlbumKeyGivenArtists(artists=artists, album=album)
+            for unwrapped_track, artists, album_key in page_entries:
 
-                # If the album this track belongs to does not exist in memory, add it.
+                # If the album this track belongs to does not exist in memory, add it. The album data comes from the
+                # client's cache thanks to the prefetch, so building it doesn't block other tiers on the network; the
+                # insert is re-checked under the lock.
                 if album_key not in memory:
-                    new_album = self.__getEmptyAlbum(track=unwrapped_track, artist_names=artists)
-                    memory[album_key] = new_album
+                    new_album = get_empty_album(track=unwrapped_track, artist_names=artists)
+                    with memory_lock:
+                        if album_key not in memory:
+                            memory[album_key] = new_album
 
                 # Add the track to memory.
-                self.__saveTrackData(
-                    track=unwrapped_track, 
-                    tier=tier, 
-                    album_key=album_key, 
-                    memory=memory,
-                    tier_tracks=tier_tracks
-                )
+                with memory_lock:
+                    save_track_data(
+                        track=unwrapped_track,
+                        tier=tier,
+                        album_key=album_key,
+                        memory=memory,
+                        tier_tracks=tier_tracks
+                    )
 
                 # Mark this track for deletion from the playlist.
-                tracks_to_delete.append(unwrapped_track[C.URI_KEY])
-
-            # Remove this batch from the playlist.
-            self.__client.removePlaylistItems(playlist_id=playlist_id, tracks=tracks_to_delete)
+                mark_for_deletion(unwrapped_track[URI_KEY], None)
 
-            # Fetch the next batch.
-            playlist_tracks = self.__client.getPlaylistItems(playlist_id=playlist_id)
+        # Remove all recorded tracks from the playlist in one pass.
+        self.__client.removePlaylistItems(playlist_id=playlist_id, tracks=list(tracks_to_delete))
 
         logger.info(f"Tier {tier} complete.")
     
 
     def __isSubset(self, subsetAlbum: Album, supersetAlbum: Album) -> bool:
         """Check if the tracks in one album are a subset of the tracks in another album."""
+        return subsetAlbum.album_track_names.issubset(supersetAlbum.album_track_names)
 
-        trackExistsInSuperset = lambda track: track in supersetAlbum.album_track_names
-        return all(trackExistsInSuperset(track) for track in subsetAlbum.album_track_names)
 
+    def __moveAlbum(self, smallerAlbum: Album, largerAlbum: Album) -> None:
+        """Move the tracks from a smaller album to a larger album, keeping the larger album's total score in sync."""
 
-    def __needsConsolidation(self, smallerAlbum: Album, largerAlbum: Album) -> bool:
-        """
-        Check if a smaller album needs to be consolidated with a larger album. Albums need consolidation if:
-            1. The smaller album and larger album have the same artists, name and year.
-            2. The tracks in the smaller album is a subset of the tracks in the larger album.
-        """
-
-        names_match = smallerAlbum.artists == largerAlbum.artists and \
-            smallerAlbum.name == largerAlbum.name and \
-            smallerAlbum.year == largerAlbum.year
-        return names_match or self.__isSubset(subsetAlbum=smallerAlbum, supersetAlbum=largerAlbum)
+        placements = largerAlbum.playlist_placements
+        for key, score in smallerAlbum.playlist_placements.items():
+            old_score = placements.get(key)
+            if old_score is None:
+                largerAlbum.total_score += score
+            elif old_score != score:
+                largerAlbum.total_score += score - old_score
+            placements[key] = score
+        largerAlbum.best_tracks.update(smallerAlbum.best_tracks)
 
 
     def __consolidateAlbums(self, memory: dict) -> None:
         """
-        Consolidates albums in memory. Some albums are spread out among multiple album entries in memory. For example, a some tracks 
+        Consolidates albums in memory. Some albums are spread out among multiple album entries in memory. For example, a some tracks
         may be in a standard version of an album and others in the deluxe version. This function would move the tracks in the regular
         version into the deluxe version and delete the regular version from memory.
 
@@ -309,45 +366,78 @@ class AlbumRanker:
         # Initialize list of keys that need to be deleted.
         keys_to_delete = set()
 
-        # Move albums that only contain a subset of tracks from other albums to the bigger album.
-        album_keys = memory.keys()
-        for l in album_keys:
-            for r in album_keys:
-                if memory[l].highest_possible_score < memory[r].highest_possible_score:
-
-                    # Check if each track in the left album is also in the right album.
-                    if (self.__needsConsolidation(smallerAlbum=memory[l], largerAlbum=memory[r])):
-
-                        # Move tracks from the smaller album to the larger album.
-                        memory[r].playlist_placements.update(memory[l].playlist_placements)
-                        memory[r].best_tracks.update(memory[l].best_tracks)
-                        keys_to_delete.add(l)
+        # Bucket albums that share artists, name and year so that only same-edition albums are compared.
+        buckets = {}
+        for key, album in memory.items():
+            buckets.setdefault((album.artists, album.name, album.year), []).append(key)
+
+        # Move every album in a bucket to the album in that bucket with the highest possible score.
+        for bucket_keys in buckets.values():
+            if len(bucket_keys) > 1:
+                largest_key = max(bucket_keys, key=lambda key: memory[key].highest_possible_score)
+                largest_album = memory[largest_key]
+                for key in bucket_keys:
+                    if memory[key].highest_possible_score < largest_album.highest_possible_score:
+                        self.__moveAlbum(smallerAlbum=memory[key], largerAlbum=largest_album)
+                        keys_to_delete.add(key)
+
+        # Group the remaining albums by artists and sort by track count so that each album only needs to be checked against the
+        # larger albums by the same artists when looking for cross-edition subsets.
+        by_artists = {}
+        for key, album in memory.items():
+            if key not in keys_to_delete:
+                by_artists.setdefault(album.artists, []).append(key)
 
-                        # End iteration after this album's match has been found.
-                        break
+        # Move albums that only contain a subset of tracks from other albums to the bigger album.
+        for artist_keys in by_artists.values():
+            artist_keys.sort(key=lambda key: len(memory[key].album_track_names))
+            for index, l in enumerate(artist_keys):
+                # Bind each album to a local once so the inner loop doesn't re-hash the album keys.
+                smaller_album = memory[l]
+                for r in artist_keys[index + 1:]:
+                    larger_album = memory[r]
+                    if r not in keys_to_delete and \
+                        smaller_album.highest_possible_score < larger_album.highest_possible_score:
+
+                        # Check if each track in the left album is also in the right album. The signature test rules
+                        # out most non-subset pairs with two integer ops before paying for the full set comparison.
+                        if (smaller_album.signature & ~larger_album.signature) == 0 and \
+                            (self.__isSubset(subsetAlbum=smaller_album, supersetAlbum=larger_album)):
+
+                            # Move tracks from the smaller album to the larger album.
+                            self.__moveAlbum(smallerAlbum=smaller_album, largerAlbum=larger_album)
+                            keys_to_delete.add(l)
+
+                            # End iteration after this album's match has been found.
+                            break
 
         # Delete the albums there were moved to larger albums.
         for key in keys_to_delete:
             del memory[key]
         keys_to_delete = set()
 
-        # Override album values using the override file.
-        album_keys = memory.keys()
-        for key in album_keys:
-            album_length_threshold_ms = self.__configs.get_album_length_threshold_min() * 60 * 1000
-            if memory[key].duration_ms < album_length_threshold_ms:
+        # The length threshold is constant for the whole run, so compute it once rather than per album, and bind the
+        # override store to a local so each album pays a plain dict get instead of a config-method dispatch.
+        album_length_threshold_ms = self.__configs.get_album_length_threshold_min() * 60 * 1000
+        overrides = self.__configs.get_all_ranker_overrides()
+
+        # Override album values using the override file. Iterate over a snapshot of the items so that each album is only
+        # looked up once and the dict is not mutated while a live view is held.
+        for key, album in list(memory.items()):
+            if album.duration_ms < album_length_threshold_ms:
                 keys_to_delete.add(key)
-            else: 
-                override = self.__configs.get_ranker_override_by_album_key(album_key=key)
+            else:
+                # The override file is still keyed by the human-readable "ARTISTS - NAME" string.
+                override = overrides.get(utilities.get_album_key(artist_names=key[0], album_name=key[1]))
                 if override:
                     if C.HIGHEST_POSSIBLE_SCORE_KEY in override:
-                        memory[key].highest_possible_score = override[C.HIGHEST_POSSIBLE_SCORE_KEY]
+                        album.highest_possible_score = override[C.HIGHEST_POSSIBLE_SCORE_KEY]
                     if C.YEAR_KEY in override:
-                        memory[key].year = override[C.YEAR_KEY]
+                        album.year = override[C.YEAR_KEY]
                     if C.NAME_KEY in override:
-                        memory[key].name = override[C.NAME_KEY]
+                        album.name = override[C.NAME_KEY]
                     if C.ARTISTS_KEY in override:
-                        memory[key].artists = override[C.ARTISTS_KEY]
+                        album.artists = override[C.ARTISTS_KEY]
             
         # Filter out short albums.
         for key in keys_to_delete:
@@ -369,123 +459,102 @@ class AlbumRanker:
         self.__client.addPlaylistItems(playlist_id=playlist_id, tracks=tracks)
 
 
-    def __executeTierTrackDiff(self, tier_tracks: dict) -> None:
+    def __executeTierTrackDiff(self, tier_tracks: list) -> None:
         """Remove tracks represented in higher tiers from lower tiers in memory."""
 
-        tier_tracks[spotify_utilities.get_tier_key(2)] = tier_tracks[spotify_utilities.get_tier_key(2)].difference(
-            tier_tracks[spotify_utilities.get_tier_key(3)]
-        )
-        tier_tracks[spotify_utilities.get_tier_key(1)] = tier_tracks[spotify_utilities.get_tier_key(1)].difference(
-            tier_tracks[spotify_utilities.get_tier_key(3)] | tier_tracks[spotify_utilities.get_tier_key(2)]
+        # Mutate the tier sets in place; difference_update avoids allocating replacement sets and the throwaway union
+        # that `.difference(a | b)` would build.
+        tier_3_tracks = tier_tracks[3]
+        tier_2_tracks = tier_tracks[2]
+        tier_1_tracks = tier_tracks[1]
+        tier_2_tracks.difference_update(tier_3_tracks)
+        tier_1_tracks.difference_update(tier_3_tracks)
+        tier_1_tracks.difference_update(tier_2_tracks)
+
+
+    def __getOutputRowFromAlbum(self, album: Album) -> tuple:
+        """Get a row for the Album Ranker output file given an album."""
+
+        return (
+            album.artists,
+            album.name,
+            album.year,
+            album.total_score,
+            album.highest_possible_score,
+            # JSON rather than repr: the sorter can then parse the list with the C-implemented json.loads instead
+            # of ast.literal_eval.
+            json.dumps(list(album.best_tracks))
         )
 
 
-    def __getOutputRowFromAlbum(self, album: Album) -> str:
-        """Get a stringified row for the Album Ranker output file given an album."""
-
-        artists = album.artists
-        name = album.name
-        year = album.year
-        total_score = sum(album.playlist_placements.values())
-        highest_score = album.highest_possible_score
-        best_songs = str(list(album.best_tracks))
-
-        return f"\n\"{artists}\",\"{name}\",{year},{total_score},{highest_score},\"{best_songs}\""
-
-
     def __writeAlbumRankerResults(self, memory: dict) -> None:
         """Write the album ranker results to a CSV file."""
 
-        logging.basicConfig(filename='album_ranker.log', level=logging.WARN)
         outputPath = self.__configs.get_ranker_output_path()
 
-        # Write the column names.
-        with open(file=outputPath, mode='w') as output_file:
-            output_file.write(C.OUTPUT_FILE_COLUMN_NAMES)
-                    
-        # Write a row for each album & keep a count of tracks for each year.
-        year_counts = {}
-        with open(file=outputPath, mode='a') as output_file:
-            album_keys = memory.keys()
-            for key in album_keys:
-                album = memory[key]
-                output_file.write(self.__getOutputRowFromAlbum(album))
-                if (album.year in year_counts):
-                    year_counts[album.year] += 1  
-                else:
-                    year_counts[album.year] = 1
+        # Assemble every row into a DataFrame and serialize it with to_csv, which quotes and writes in a single
+        # C-level pass instead of one Python-level write per row.
+        output_df = pd.DataFrame(
+            (self.__getOutputRowFromAlbum(album) for album in memory.values()),
+            columns=C.OUTPUT_FILE_COLUMN_NAMES.split(',')
+        )
+        output_df.to_csv(outputPath, index=False)
 
         # Log a warning if there are more than the threshold number of tier 3 tracks in a given year.
-        for key in year_counts:
-            if year_counts[key] > self.__configs.get_tier_3_yearly_threshold():
-                logger.warning(f"Warning: {year_counts[key]} tier 3 tracks in year {key}.")
+        threshold = self.__configs.get_tier_3_yearly_threshold()
+        year_counts = output_df[C.SORTER_YEAR_KEY].value_counts()
+        for year, count in year_counts[year_counts > threshold].items():
+            logger.warning(f"Warning: {count} tier 3 tracks in year {year}.")
 
 
-    def __executeAllTiers(self, memory: dict, tier_tracks:dict) -> None:
+    def __executeAllTiers(self, memory: dict, tier_tracks: list) -> None:
         """Collect scoring metadata on all tier playlists."""
 
-        # Execute tier 3:
-        self.__executeTier(
-            playlist_id=self.__configs.get_tier_3_playlist_id(),
-            tier=3,
-            memory=memory,
-            tier_tracks=tier_tracks
-        )
-
-        # Execute tier 2:
-        self.__executeTier(
-            playlist_id=self.__configs.get_tier_2_playlist_id(),
-            tier=2,
-            memory=memory,
-            tier_tracks=tier_tracks
-        )
-
-        # Execute tier 1:
-        self.__executeTier(
-            playlist_id=self.__configs.get_tier_1_playlist_id(),
-            tier=1,
-            memory=memory,
-            tier_tracks=tier_tracks
-        )   
-
-
-    def __addTracksBackToTierPlaylists(self, tier_tracks: dict) -> None:
+        # The three tier playlists are independent and each spends most of its time waiting on Spotify round-trips, so
+        # fetch them concurrently. Saving a track is idempotent and order-independent across tiers, so the only
+        # coordination needed is the memory lock around the in-memory updates in __executeTier.
+        playlist_ids_and_tiers = [
+            (self.__configs.get_tier_3_playlist_id(), 3),
+            (self.__configs.get_tier_2_playlist_id(), 2),
+            (self.__configs.get_tier_1_playlist_id(), 1)
+        ]
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(self.__executeTier, playlist_id, tier, memory, tier_tracks)
+                for playlist_id, tier in playlist_ids_and_tiers
+            ]
+            for future in futures:
+                future.result()
+
+
+    def __addTracksBackToTierPlaylists(self, tier_tracks: list) -> None:
         """Add all tracks back to tier playlists that were deleted during the process of collecting scoring metadata."""
 
-        # Add tracks back to tier 3 playlist.
-        self.__addTracksToPlaylist(
-            tier=3, 
-            playlist_id=self.__configs.get_tier_3_playlist_id(), 
-            tracks=tier_tracks[spotify_utilities.get_tier_key(3)]
-        )
-
-        # Add tracks back to tier 2 playlist.
-        self.__addTracksToPlaylist(
-            tier=2, 
-            playlist_id=self.__configs.get_tier_2_playlist_id(), 
-            tracks=tier_tracks[spotify_utilities.get_tier_key(2)]
-        )
-
-        # Add tracks back to tier 1 playlist.
-        self.__addTracksToPlaylist(
-            tier=1, 
-            playlist_id=self.__configs.get_tier_1_playlist_id(), 
-            tracks=tier_tracks[spotify_utilities.get_tier_key(1)]
-        )
+        # Each tier adds to its own playlist and the tier sets are disjoint after the track diff, so the three
+        # add-back passes are independent and spend their time on Spotify round-trips; run them concurrently.
+        tiers_playlist_ids_and_tracks = [
+            (3, self.__configs.get_tier_3_playlist_id(), tier_tracks[3]),
+            (2, self.__configs.get_tier_2_playlist_id(), tier_tracks[2]),
+            (1, self.__configs.get_tier_1_playlist_id(), tier_tracks[1])
+        ]
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(self.__addTracksToPlaylist, tier, playlist_id, tracks)
+                for tier, playlist_id, tracks in tiers_playlist_ids_and_tracks
+            ]
+            for future in futures:
+                future.result()
 
 
     def run(self) -> None:
         """Runs the Album Ranker."""
 
-        t0 = dt.datetime.now()
+        t0 = time.monotonic()
 
-        # Initialize memory:
+        # Initialize memory. The tier track sets live in a list indexed by tier (slot 0 unused) so the hot loops reach
+        # them with an array index instead of hashing a tier-key string on every access.
         memory = {}
-        tier_tracks = {
-            spotify_utilities.get_tier_key(3): set(),
-            spotify_utilities.get_tier_key(2): set(),
-            spotify_utilities.get_tier_key(1): set()
-        }
+        tier_tracks = [None, set(), set(), set()]
 
         # Collect scoring metadata for all tiers:
         self.__executeAllTiers(memory=memory, tier_tracks=tier_tracks)
@@ -502,10 +571,11 @@ class AlbumRanker:
         # Write ranker results to file:
         self.__writeAlbumRankerResults(memory=memory)
 
-        logger.info(f"Ranker completed in {utilities.get_seconds_since_datetime(t0)} seconds.")
+        logger.info(f"Ranker completed in {utilities.get_seconds_since(t0)} seconds.")
         
         
 if __name__ == "__main__":
+    logging.basicConfig(filename='./log/album_ranker.log', level=logging.INFO)
     configs = SparseConfigs()
     client = SpotifyClient(configs=configs)
     ranker = AlbumRanker(configs=configs, client=client)
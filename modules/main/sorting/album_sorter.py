@@ -1,6 +1,13 @@
 
+import numpy as np
 import pandas as pd
 import ast
+import json
+import os
+import sys
+from collections import Counter, deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from difflib import SequenceMatcher
 from itertools import chain
 from modules.main.configs.sparse_configs import SparseConfigs
 from modules.main.spotify.spotify_client import SpotifyClient
@@ -9,6 +16,23 @@ import modules.main.spotify.spotify_utilities as spotify_utilities
 import modules.main.util.utilities as utilities
 
 
+# An album still waiting for a genre assignment. A namedtuple keeps tuple semantics (unpacking, len, equality with
+# plain tuples) while naming the fields at use sites.
+UngenredAlbum = namedtuple("UngenredAlbum", ["artist_names", "album_name"])
+
+# Fixed column dtypes for the ranker output CSV. Declaring them lets read_csv skip its type-inference pass, and the
+# narrow numeric types halve the bytes the year and rating filters move. Years and scores fit comfortably in
+# int16/float32.
+_RANKER_OUTPUT_DTYPES = {
+    C.SORTER_ARTISTS_KEY: str,
+    C.SORTER_ALBUM_NAME_KEY: str,
+    C.SORTER_YEAR_KEY: "int16",
+    C.SORTER_TOTAL_SCORE_KEY: "float32",
+    C.SORTER_HIGHEST_POSSIBLE_SCORE_KEY: "float32",
+    C.SORTER_TIER_3_TRACKS_KEY: str
+}
+
+
 class AlbumSorter():
     """
     A class representing an Album Sorter.
@@ -25,17 +49,51 @@ class AlbumSorter():
 
         self.__configs = configs
         self.__client = client
+        # Modification time of the ranker output the current frame was parsed from; refresh_df only re-reads the CSV
+        # when this changes.
+        self.__df_mtime_ns = None
+        # Last computed genre keyword list, keyed by the configs' genre-name snapshot so repeat calls between genre
+        # updates skip the word counting entirely.
+        self.__genre_keywords_cache = None
+        # Boolean masks per genre filter, valid for the currently parsed frame.
+        self.__genre_mask_cache = {}
         self.refresh_df()
     
 
+    def __get_genre_mask(self, genre: str) -> pd.Series:
+        """
+        Get the boolean mask selecting the albums that match a genre or genre keyword. Masks are cached per parsed
+        frame, so re-rendering pages of the same filter doesn't re-scan the genre column; the cache is dropped
+        whenever the frame or a genre assignment changes.
+        """
+
+        mask = self.__genre_mask_cache.get(genre)
+        if mask is None:
+            genres_column = self.__df[C.SORTER_GENRES_KEY]
+            if genre.endswith(C.KEYWORD_SUFFIX):
+                # Keyword search: a literal substring match anywhere in the genre list. regex=False routes through
+                # the C substring search instead of compiling the keyword as a pattern.
+                mask = genres_column.str.contains(genre[:-len(C.KEYWORD_SUFFIX)], regex=False, na=False)
+            else:
+                # Full-genre search: the genre must appear as a whole comma-separated entry.
+                mask = (
+                    genres_column.str.startswith(f"{genre},", na=False) |
+                    genres_column.str.contains(f", {genre}, ", regex=False, na=False) |
+                    genres_column.str.endswith(f", {genre}", na=False) |
+                    (genres_column == genre)
+                )
+            self.__genre_mask_cache[genre] = mask
+        return mask
+
+
     def __get_filtered_df(self, year: int, genre: str = None) -> pd.DataFrame:
         """
         Return a copy of the album data that has been filtered by year and/or genre keyword.
 
         Args:
-            year (int): The year that all albums in the filtered dataframe must match. 
+            year (int): The year that all albums in the filtered dataframe must match.
                 If None, return all available years.
-            genre (str): The keyword that the full genre must contain for all albums in the filtered dataframe. 
+            genre (str): The keyword that the full genre must contain for all albums in the filtered dataframe.
                 If None, return all available genres.
 
         Return:
@@ -43,85 +101,130 @@ class AlbumSorter():
         """
 
         # If year and genre_keyword are not empty, filter on both.
-        if (year != None) & (genre != None):
-            contains_word_suffix = genre.endswith(C.KEYWORD_SUFFIX)
-            return self.__df[
-                (self.__df[C.SORTER_YEAR_KEY] == year) &
-                    (
-                        (contains_word_suffix & self.__df[C.SORTER_GENRES_KEY].str.contains(genre[:-len(C.KEYWORD_SUFFIX)], na=False)) |
-                        (~contains_word_suffix & (
-                            (self.__df[C.SORTER_GENRES_KEY].str.startswith(f"{genre},", na=False)) |
-                            (self.__df[C.SORTER_GENRES_KEY].str.contains(f", {genre}, ", na=False)) |
-                            (self.__df[C.SORTER_GENRES_KEY].str.endswith(f", {genre}", na=False)) |
-                            (self.__df[C.SORTER_GENRES_KEY].str == genre)
-                        ))
-                    )
-            ]
-        
+        if year is not None and genre is not None:
+            return self.__df[(self.__df[C.SORTER_YEAR_KEY] == year) & self.__get_genre_mask(genre)]
+
         # If year is not empty but genre_keyword is, just filter on year.
-        elif year != None:
+        elif year is not None:
             return self.__df[self.__df[C.SORTER_YEAR_KEY] == year]
-        
+
         # If genre_keyword is not empty but year is, just filter on genre_keyword.
-        elif genre != None:
-            contains_word_suffix = genre.endswith(C.KEYWORD_SUFFIX)
-            return self.__df[(
-                (contains_word_suffix & self.__df[C.SORTER_GENRES_KEY].str.contains(genre[:-len(C.KEYWORD_SUFFIX)], na=False)) |
-                (~contains_word_suffix & (
-                    (self.__df[C.SORTER_GENRES_KEY].str.startswith(f"{genre},", na=False)) |
-                    (self.__df[C.SORTER_GENRES_KEY].str.contains(f", {genre}, ", na=False)) |
-                    (self.__df[C.SORTER_GENRES_KEY].str.endswith(f", {genre}", na=False)) |
-                    (self.__df[C.SORTER_GENRES_KEY].str == genre)
-                ))
-            )]
-        
+        elif genre is not None:
+            return self.__df[self.__get_genre_mask(genre)]
+
         # If both year and genre_keyword are empty, return all available album data.
         else:
             return self.__df
 
 
-    def __album_data_to_str(self, df: pd.DataFrame) -> str:
-        """Convert an album DataFrame to a readable string."""
-
-        # Create rating column.
-        df[C.SORTER_RATING_KEY] = (df[C.SORTER_TOTAL_SCORE_KEY] / df[C.SORTER_HIGHEST_POSSIBLE_SCORE_KEY]) * 100
-
-        # Limit length of columns.
-        df[C.SORTER_ALBUM_NAME_KEY] = df[C.SORTER_ALBUM_NAME_KEY].transform(lambda s: s[:40])
-        df[C.SORTER_ARTISTS_KEY] = df[C.SORTER_ARTISTS_KEY].transform(lambda s: s[:40])
-        df[C.SORTER_GENRES_KEY] = df[C.SORTER_GENRES_KEY].transform(lambda s: s[:30])
+    def __album_data_to_str(self, df: pd.DataFrame, limit: int = None, offset: int = 0) -> str:
+        """
+        Convert an album DataFrame to a readable string. If a limit is provided, only the requested page of rows is
+        formatted; the index still reflects each album's overall rank.
+        """
 
-        # Drop unnecessary columns and sort by rating.
-        dropped_df = df.drop([C.SORTER_TOTAL_SCORE_KEY, C.SORTER_HIGHEST_POSSIBLE_SCORE_KEY, C.SORTER_TIER_3_TRACKS_KEY], axis=1) \
+        # Build the display frame in one assign/drop/sort chain: assign leaves the (possibly cached) input frame
+        # untouched and produces a single new frame instead of one copy plus four in-place column writes. The rating
+        # division runs on the underlying arrays, and .str.slice truncates in the pandas string kernel.
+        dropped_df = df.assign(**{
+            C.SORTER_RATING_KEY: (
+                df[C.SORTER_TOTAL_SCORE_KEY].to_numpy() / df[C.SORTER_HIGHEST_POSSIBLE_SCORE_KEY].to_numpy()
+            ) * 100,
+            C.SORTER_ALBUM_NAME_KEY: df[C.SORTER_ALBUM_NAME_KEY].str.slice(0, 40),
+            C.SORTER_ARTISTS_KEY: df[C.SORTER_ARTISTS_KEY].str.slice(0, 40),
+            C.SORTER_GENRES_KEY: df[C.SORTER_GENRES_KEY].str.slice(0, 30)
+        }) \
+            .drop([C.SORTER_TOTAL_SCORE_KEY, C.SORTER_HIGHEST_POSSIBLE_SCORE_KEY], axis=1) \
             .sort_values(by=C.SORTER_RATING_KEY, ascending=False) \
             .reset_index(drop=True)
         dropped_df.index += 1
 
+        # Slice out the requested page after sorting so pagination follows the rating order.
+        if limit is not None:
+            dropped_df = dropped_df.iloc[offset:offset + limit]
+
         # Convert to markdown to improve readability.
-        return dropped_df.to_markdown()
+        return self.__df_to_markdown(dropped_df)
     
 
+    @staticmethod
+    def __format_cell(value: any) -> str:
+        """Convert a cell value to display text. Floats use %g so ratings don't print float32 noise digits."""
+        if isinstance(value, (float, np.floating)):
+            return f"{value:g}"
+        return str(value)
+
+
+    @classmethod
+    def __df_to_markdown(cls, df: pd.DataFrame) -> str:
+        """
+        Render a DataFrame as a markdown table. One width pass and one join per row replaces to_markdown, which
+        routes every cell through tabulate's repeated measuring passes (and tabulate isn't a declared dependency).
+        """
+
+        headers = [""] + [str(column) for column in df.columns]
+        rows = [
+            [cls.__format_cell(index)] + [cls.__format_cell(value) for value in row]
+            for index, row in zip(df.index, df.itertuples(index=False, name=None))
+        ]
+        widths = [
+            max(len(header), max((len(row[column]) for row in rows), default=0))
+            for column, header in enumerate(headers)
+        ]
+
+        lines = [
+            "| " + " | ".join(header.ljust(width) for header, width in zip(headers, widths)) + " |",
+            "|" + "|".join("-" * (width + 2) for width in widths) + "|"
+        ]
+        lines.extend(
+            "| " + " | ".join(cell.ljust(width) for cell, width in zip(row, widths)) + " |"
+            for row in rows
+        )
+        return "\n".join(lines)
+
+
+    @staticmethod
+    def __parse_track_list(stored_tracks: str) -> list:
+        """
+        Parse a stored tier 3 track list. New ranker output stores the list as JSON (parsed by the C-implemented
+        json.loads); files written by older runs used the Python repr, so fall back to ast.literal_eval for those.
+        """
+        try:
+            return json.loads(stored_tracks)
+        except ValueError:
+            return ast.literal_eval(stored_tracks)
+
+
     def __get_albums_with_unknown_genre(self) -> pd.DataFrame:
         """Fetch albums whose genre has not been determined yet from memory."""
         return self.__df[self.__df[C.SORTER_GENRES_KEY] == C.UNKNOWN_GENRE_NAME]
 
     
-    def __add_tracks_to_genre_playlist(self, tracks_ids: list, genre: str) -> None:
-        """Add a list of tracks to a genre-specific playlist in the user's library. Creates a new playlist if one doesn't exist yet."""
+    def __get_or_create_genre_playlist(self, genre: str) -> str:
+        """Get the playlist URI for a genre playlist in the user's library, creating a new playlist if one doesn't exist yet."""
+
+        # Use pre-existing genre playlist if it exists, otherwise create a new one.
+        playlistFromFile = self.__configs.get_genre_playlist_by_name(name=genre)
+        if playlistFromFile:
+            return playlistFromFile
+        playlist_uri = self.__client.createUserPlaylist(playlist_title=genre)
+        self.__configs.update_playlist_data(genre=genre, playlist_id=playlist_uri)
+        return playlist_uri
+
+
+    def __add_tracks_to_genre_playlists(self, tracks_ids: list, genres_list: list) -> None:
+        """Add a list of tracks to the genre-specific playlist for each genre. Creates any playlists that don't exist yet."""
 
         # Do nothing if no tracks were passed in.
         if tracks_ids != []:
 
-            # Use pre-existing genre playlist if it exists, otherwise create a new one.
-            playlistFromFile = self.__configs.get_genre_playlist_by_name(name=genre)
-            if playlistFromFile:
-                playlist_uri = playlistFromFile
-            else:
-                playlist_uri = self.__client.createUserPlaylist(playlist_title=genre)
-                self.__configs.update_playlist_data(genre=genre, playlist_id=playlist_uri)
-
-            # Add the tracks to the playlist.
-            self.__client.addPlaylistItems(playlist_id=playlist_uri, tracks=tracks_ids)
+            # Resolve every playlist first (creating the missing ones touches the config store, so it stays serial),
+            # then fan the adds out concurrently — each add is an independent round-trip per genre.
+            playlist_uris = [self.__get_or_create_genre_playlist(genre=genre) for genre in genres_list]
+            add_tracks = lambda playlist_uri: self.__client.addPlaylistItems(playlist_id=playlist_uri, tracks=tracks_ids)
+            with ThreadPoolExecutor(max_workers=min(4, len(playlist_uris))) as executor:
+                # Drain the iterator so a failure in any add propagates to the caller.
+                list(executor.map(add_tracks, playlist_uris))
             
 
     def __write_genres(self, artist_names: str, album_name: str, genres_list: list) -> None:
@@ -165,56 +268,93 @@ class AlbumSorter():
 
         
     def refresh_df(self) -> None:
-        """Refresh the album data in memory based on the data on disk."""
+        """
+        Refresh the album data in memory based on the data on disk. The CSV is only re-parsed when its modification
+        time changes; every other call is a single stat. Genre assignments made through this sorter update the cached
+        frame in place, so they never force a re-read.
+        """
 
-        # Read the album data from disk.
-        self.__df = pd.read_csv(self.__configs.get_ranker_output_path())
+        # Skip the re-read entirely if the ranker output hasn't changed since the last parse.
+        mtime_ns = os.stat(self.__configs.get_ranker_output_path()).st_mtime_ns
+        if mtime_ns == self.__df_mtime_ns:
+            return
+        self.__df_mtime_ns = mtime_ns
+
+        # Read the album data from disk with the known column dtypes, skipping pandas' inference pass.
+        self.__df = pd.read_csv(self.__configs.get_ranker_output_path(), dtype=_RANKER_OUTPUT_DTYPES)
+        self.__genre_mask_cache = {}
+
+        # Enrich with genre data from disk. A single left merge on (artists, album name) joins every genre record in
+        # one C-level hash join instead of one full-dataframe mask and .loc assignment per genred album.
+        genre_records = [
+            self.__configs.get_ranked_album_genres_by_album_key(key)
+            for key in self.__configs.get_genred_album_keys()
+        ]
+        if genre_records:
+            genre_df = pd.DataFrame(genre_records)
+            self.__df = self.__df.merge(genre_df, on=[C.SORTER_ARTISTS_KEY, C.SORTER_ALBUM_NAME_KEY], how='left')
+            self.__df[C.SORTER_GENRES_KEY] = self.__df[C.SORTER_GENRES_KEY].fillna(C.UNKNOWN_GENRE_NAME)
+        else:
+            self.__df[C.SORTER_GENRES_KEY] = C.UNKNOWN_GENRE_NAME
 
-        # Enrich with genre data from disk.
-        self.__df[C.SORTER_GENRES_KEY] = C.UNKNOWN_GENRE_NAME
-        for key in self.__configs.get_genred_album_keys():
-            genre_data = self.__configs.get_ranked_album_genres_by_album_key(key)
-            self.__df.loc[
-                (self.__df[C.SORTER_ARTISTS_KEY] == genre_data[C.SORTER_ARTISTS_KEY]) & 
-                    (self.__df[C.SORTER_ALBUM_NAME_KEY] == genre_data[C.SORTER_ALBUM_NAME_KEY]), 
-                C.SORTER_GENRES_KEY
-            ] = genre_data[C.SORTER_GENRES_KEY] 
+        # The artists and genres columns repeat a small set of values across many rows. Interning collapses the
+        # duplicates to shared string objects — the album keys then hash/compare against the interned strings the
+        # Spotify utilities already produce, usually on pointer identity.
+        self.__df[C.SORTER_ARTISTS_KEY] = self.__df[C.SORTER_ARTISTS_KEY].map(sys.intern)
+        self.__df[C.SORTER_GENRES_KEY] = self.__df[C.SORTER_GENRES_KEY].map(sys.intern)
 
+        # Split the wide tier 3 track-list strings out of the working frame. Only the tier 3 listing and genre
+        # assignment read them, so every filter, sort and display copy stops dragging the largest column along. The
+        # series keeps the frame's index, so filtered frames can still look their rows up by label.
+        self.__tier_3_tracks = self.__df.pop(C.SORTER_TIER_3_TRACKS_KEY)
 
-    def get_next_album_with_unknown_genre(self) -> list:
+        # Queue up the albums that still need a genre so fetching the next one is O(1) instead of a full dataframe
+        # scan per GUI confirmation. Confirmed albums are removed from the queue in assign_genres_to_album.
+        albums_with_unknown_genre = self.__get_albums_with_unknown_genre()
+        self.__ungenred_queue = deque(
+            UngenredAlbum(artist_names, album_name)
+            for artist_names, album_name in zip(
+                albums_with_unknown_genre[C.SORTER_ARTISTS_KEY],
+                albums_with_unknown_genre[C.SORTER_ALBUM_NAME_KEY]
+            )
+        )
+
+        # Index each (artists, album name) pair to its row position so genre assignment finds its album with one dict
+        # lookup instead of two full-column equality scans.
+        self.__album_index = dict(zip(
+            zip(self.__df[C.SORTER_ARTISTS_KEY], self.__df[C.SORTER_ALBUM_NAME_KEY]),
+            range(len(self.__df))
+        ))
+
+
+    def get_next_album_with_unknown_genre(self) -> UngenredAlbum:
         """Get an album that doesn't have a genre assignment yet. If all albums are assigned, return None."""
 
-        self.refresh_df()
-        albums_with_unknown_genre = self.__get_albums_with_unknown_genre()
-        if len(albums_with_unknown_genre) != 0:
-            unknown_row = albums_with_unknown_genre.iloc[0]
-            return [unknown_row[C.SORTER_ARTISTS_KEY], unknown_row[C.SORTER_ALBUM_NAME_KEY]]
-        else: 
-            return None
+        if self.__ungenred_queue:
+            return self.__ungenred_queue[0]
+        return None
 
 
     def get_genre_keywords(self) -> list:
         """Get a list of all genres and all words that appear in more than one genre. Includes an entry for all genres."""
 
-        all_genres = self.__configs.get_genre_playlists_names()
-        genre_word_counts = {}
+        # The configs hand out the same tuple until a genre playlist is added, so it doubles as a cache key: serve the
+        # previous result until the snapshot changes.
+        genres_snapshot = self.__configs.get_all_genres()
+        if self.__genre_keywords_cache is not None and self.__genre_keywords_cache[0] is genres_snapshot:
+            return list(self.__genre_keywords_cache[1])
 
-        # Gather words and counts from genres.
-        for genre in all_genres:
-            for word in genre.split(' '):
-                keyword = f"{word}{C.KEYWORD_SUFFIX}"
-                if keyword not in genre_word_counts:
-                    genre_word_counts[keyword] = 1
-                else:
-                    genre_word_counts[keyword] += 1
+        all_genres = list(genres_snapshot)
 
-        # Add words that appear in more than one genre.
-        for word, count in genre_word_counts.items():
-            if (count > 1):
-                all_genres.append(word)
+        # Count genre words in a single C-level pass, then turn the words that appear in more than one genre into
+        # keyword entries.
+        genre_word_counts = Counter(word for genre in all_genres for word in genre.split(' '))
+        keywords = [f"{word}{C.KEYWORD_SUFFIX}" for word, count in genre_word_counts.items() if count > 1]
 
-        # Return sorted list of words and genres.
-        return [C.ALL_GENRES_NAME] + sorted(all_genres)
+        # Cache and return the sorted list of words and genres. Callers get a fresh copy since some append to it.
+        result = [C.ALL_GENRES_NAME] + sorted(all_genres + keywords)
+        self.__genre_keywords_cache = (genres_snapshot, result)
+        return list(result)
 
 
     def get_years(self) -> list:
@@ -222,12 +362,15 @@ class AlbumSorter():
         return [C.ALL_YEARS_NAME] + sorted(self.__df[C.SORTER_YEAR_KEY].unique().tolist(), reverse=True)
 
 
-    def get_album_list(self, year: int, genre: str) -> str:
-        """Get the human-readable list of albums, filtered by year and genre keyword."""
+    def get_album_list(self, year: int, genre: str, limit: int = None, offset: int = 0) -> str:
+        """
+        Get the human-readable list of albums, filtered by year and genre keyword. If a limit is provided, only that
+        page of rows (starting at offset) is formatted, so render cost stays constant for large collections.
+        """
 
         self.refresh_df()
         df = self.__get_filtered_df(year=year, genre=genre)
-        return self.__album_data_to_str(df)
+        return self.__album_data_to_str(df, limit=limit, offset=offset)
 
 
     def get_tier_3_tracks(self, year: int) -> str:
@@ -239,21 +382,25 @@ class AlbumSorter():
         self.refresh_df()
         df = self.__get_filtered_df(year=year)
 
-        # Convert the stringified list of track URIs to a python list.
+        # Convert the stringified list of track URIs to a python list. The track-list strings live outside the
+        # working frame; the filtered frame's index selects the matching rows.
         all_tier_3_tracks = list(chain.from_iterable(
-            df[C.SORTER_TIER_3_TRACKS_KEY].apply(lambda tracks: ast.literal_eval(tracks)).tolist()
+            self.__tier_3_tracks.loc[df.index].map(self.__parse_track_list).tolist()
         ))
 
-        formatted_tracks = []
+        # Format the rows in one list comprehension; join consumes the generator of artist names directly, with no
+        # lambda dispatch or throwaway list per track.
         tracks = self.__client.getTracks(track_uris=all_tier_3_tracks)
-        for track in tracks:
-            formatted_tracks.append([
-                ", ".join(list(map(lambda artist: artist[C.NAME_KEY], track[C.ARTISTS_KEY])))[:40], 
-                track[C.ALBUM_KEY][C.NAME_KEY][:40], 
+        formatted_tracks = [
+            [
+                ", ".join(artist[C.NAME_KEY] for artist in track[C.ARTISTS_KEY])[:40],
+                track[C.ALBUM_KEY][C.NAME_KEY][:40],
                 track[C.NAME_KEY][:40]
-            ])
+            ]
+            for track in tracks
+        ]
 
-        return pd.DataFrame(formatted_tracks).to_markdown()
+        return self.__df_to_markdown(pd.DataFrame(formatted_tracks))
 
 
     def assign_genres_to_album(self, artist_names: str, album_name: str, genres_list: list) -> None:
@@ -266,24 +413,32 @@ class AlbumSorter():
             genres_str (str): The comma-separated list of genres for this album.
         """
 
-        # Fetch the album from memory.
-        ranked_album = self.__df[
-            (self.__df[C.SORTER_ARTISTS_KEY] == artist_names) & 
-            (self.__df[C.SORTER_ALBUM_NAME_KEY] == album_name)
-        ]
+        # Fetch the album's row position from the index.
+        row = self.__album_index.get((artist_names, album_name))
 
-        if (not ranked_album.empty) and (genres_list != []):
+        if (row is not None) and (genres_list != []):
 
             # Get the tier 3 tracks from the ranked album.
-            track_ids = ast.literal_eval(ranked_album.iloc[0][C.SORTER_TIER_3_TRACKS_KEY])
-            
+            track_ids = self.__parse_track_list(self.__tier_3_tracks.iat[row])
+
             # Add the tier 3 tracks to the genre playlist for each genre.
-            for genre in genres_list:
-                self.__add_tracks_to_genre_playlist(track_ids, genre)
+            self.__add_tracks_to_genre_playlists(tracks_ids=track_ids, genres_list=genres_list)
 
             # Record the genre for this ranked album.
             self.__write_genres(artist_names=artist_names, album_name=album_name, genres_list=genres_list)
 
+            # Mirror the assignment into the cached frame so it stays current without a CSV re-read, and drop the
+            # genre masks computed against the old column contents.
+            self.__df.iat[row, self.__df.columns.get_loc(C.SORTER_GENRES_KEY)] = ", ".join(genres_list)
+            self.__genre_mask_cache = {}
+
+            # Drop the album from the ungenred queue so the next lookup doesn't serve it again.
+            entry = (artist_names, album_name)
+            if self.__ungenred_queue and self.__ungenred_queue[0] == entry:
+                self.__ungenred_queue.popleft()
+            elif entry in self.__ungenred_queue:
+                self.__ungenred_queue.remove(entry)
+
 
     def add_override(
         self, 
@@ -306,6 +461,11 @@ class AlbumSorter():
         self.__configs.update_overrides(album_key=album_key, override_data=override_data)
         return override_data
 
+    def flush_configs(self) -> None:
+        """Write any pending config changes (genres, overrides, playlists) to disk."""
+        self.__configs.flush_all()
+
+
     def get_similar_genres(self, genre: str) -> list:
         """
         Get a list of genres that are similar to the provided genre.
@@ -323,4 +483,33 @@ class AlbumSorter():
             all_genres
         ))
 
-        return similar_genres
\ No newline at end of file
+        return similar_genres
+
+
+    def get_similar_genres_bulk(self, genres: list) -> dict:
+        """
+        Get the similar genres for several genres with a single walk over the known genre list, instead of one walk
+        per queried genre.
+
+        Args:
+            genres (list): The genres to find similar genres for.
+
+        Returns:
+            dict: A mapping from each queried genre to its list of similar genres.
+        """
+        all_genres = self.__configs.get_all_genres()
+        threshold = C.GENRE_SIMILARITY_THRESHOLD
+
+        matches = {genre: [] for genre in genres}
+        for genre, similar_genres in matches.items():
+            # One SequenceMatcher per queried genre: set_seq2 caches the query's character index across every
+            # candidate, and the quick-ratio upper bounds skip the expensive full ratio for clearly dissimilar pairs.
+            matcher = SequenceMatcher()
+            matcher.set_seq2(genre)
+            for genre_from_file in all_genres:
+                matcher.set_seq1(genre_from_file)
+                if matcher.real_quick_ratio() > threshold and matcher.quick_ratio() > threshold:
+                    if 1 > matcher.ratio() > threshold:
+                        similar_genres.append(genre_from_file)
+
+        return matches
\ No newline at end of file
@@ -1,4 +1,7 @@
+import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from itertools import batched
 import spotipy
 from spotipy.oauth2 import SpotifyOAuth
@@ -13,6 +16,9 @@ class SpotifyClient:
     __redirect_uri = "https://example.com/callback"
     # The scope for the python API. We need modify permissions to remove all tracks from each temp playlist and add them back.
     __scope = "playlist-modify-public"
+    # Only the playlist-track fields the ranker actually reads. Asking Spotify to filter the payload server-side keeps
+    # the JSON transferred and parsed per page to a fraction of the full response.
+    __playlist_fields = "items(track(uri,name,duration_ms,album(uri,name,release_date,artists(name)))),next"
 
 
     def __init__(self, configs: SparseConfigs):
@@ -30,83 +36,150 @@ class SpotifyClient:
             scope=self.__scope
         ))
         self.__user = configs.get_user()
+        # Albums fetched during this run, grouped by album ID. The same album is requested once per track it contains,
+        # so caching the response avoids a Spotify round-trip for every repeat ID.
+        self.__album_cache = {}
+        self.__album_cache_lock = threading.Lock()
+        # Tracks fetched during this run, grouped by track URI. The tier 3 listings re-request the same URIs every
+        # time the user changes year, so repeat fetches are served from memory instead of the network.
+        self.__track_cache = {}
+        self.__track_cache_lock = threading.Lock()
 
 
-    def __run_with_retry(
-        self, 
-        func, 
-        param_1: any = None, 
-        param_2: any = None, 
-        max_retries: int=3, 
-        delay_seconds: int=1
-    ) -> any:
+    def __run_with_retry(self, func, *args, max_retries: int=3, delay_seconds: int=1) -> any:
         """
         Run something with a variable number of times if an exception is encountered.
 
         Args:
             func (function): The function containing the call to the resource.
-            param_1 (any): The first param to pass into `func`.
-            param_2 (any): The second param to pass into `func`.
-            retries (int): The number of retries before throwing an exception. 2 by default.
-            delay_seconds (int): Delay between tries in seconds.
+            *args (any): The positional params to pass into `func`.
+            max_retries (int): The number of tries before throwing an exception. 3 by default.
+            delay_seconds (int): Base delay between tries in seconds. Doubled on each failed attempt.
         """
 
         for attempt in range(max_retries):
             try:
-                return func(param_1, param_2)
+                return func(*args)
             except Exception as e:
                 if attempt == max_retries - 1:
                     raise  # Re-raise exception on the last attempt
-                print(f"Attempt {attempt + 1} failed: {e}, retrying in {delay_seconds} seconds...")
-                time.sleep(delay_seconds)
+
+                # Back off exponentially with a little jitter so retries don't hammer a struggling endpoint in
+                # lockstep. When Spotify rate-limits us it says how long to wait, so honor that instead.
+                delay = delay_seconds * (2 ** attempt) + random.uniform(0, 0.5)
+                if isinstance(e, spotipy.SpotifyException) and e.http_status == 429:
+                    delay = int((e.headers or {}).get('Retry-After', delay))
+                print(f"Attempt {attempt + 1} failed: {e}, retrying in {delay} seconds...")
+                time.sleep(delay)
 
 
     def getAlbum(self, album_id: str) -> dict:
-        """Try to fetch an album using the Spotify client."""
-        return self.__run_with_retry(func=self.__client.album, param_1=album_id)
+        """Try to fetch an album using the Spotify client. Repeat fetches of the same album ID are served from a cache."""
+
+        with self.__album_cache_lock:
+            if album_id in self.__album_cache:
+                return self.__album_cache[album_id]
+
+        album = self.__run_with_retry(self.__client.album, album_id)
+
+        with self.__album_cache_lock:
+            return self.__album_cache.setdefault(album_id, album)
+
+
+    def getAlbums(self, album_ids: list) -> None:
+        """
+        Try to fetch several albums at once using the Spotify client, 20 per request, skipping albums already in the
+        cache. Subsequent getAlbum calls for these IDs are then served from the cache without a round-trip.
+
+        Args:
+            album_ids (list): The Spotify album IDs to fetch.
+        """
+
+        with self.__album_cache_lock:
+            missing = [album_id for album_id in dict.fromkeys(album_ids) if album_id not in self.__album_cache]
+
+        for batch in batched(missing, 20):
+            results = self.__run_with_retry(self.__client.albums, batch)
+            with self.__album_cache_lock:
+                for album in results[C.ALBUMS_KEY]:
+                    self.__album_cache.setdefault(album[C.URI_KEY], album)
 
 
     def getPlaylistItems(self, playlist_id: str) -> dict:
         """Try to fetch the tracks from a playlist using the Spotify client."""
-        return self.__run_with_retry(func=self.__client.playlist, param_1=playlist_id)[C.TRACKS_KEY][C.ITEMS_KEY]
+        return self.__run_with_retry(self.__client.playlist, playlist_id)[C.TRACKS_KEY][C.ITEMS_KEY]
+
+
+    def getPlaylistItemsPaged(self, playlist_id: str):
+        """
+        Try to fetch the tracks from a playlist using the Spotify client, one page of 100 tracks at a time. Spotify
+        pagination is stable, so the caller does not need to mutate the playlist between pages to see every track.
+        While the caller processes a page, the next page is already being fetched on a background thread, hiding the
+        per-page round-trip behind the processing time.
+
+        Yields:
+            list: The next page of playlist tracks.
+        """
+
+        results = self.__run_with_retry(self.__client.playlist_items, playlist_id, self.__playlist_fields)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            while results[C.NEXT_KEY]:
+                next_page = executor.submit(self.__run_with_retry, self.__client.next, results)
+                yield results[C.ITEMS_KEY]
+                results = next_page.result()
+        yield results[C.ITEMS_KEY]
 
 
     def getTracks(self, track_uris) -> list:
-        """Try to fetch tracks using Spotify client."""
+        """
+        Try to fetch tracks using the Spotify client, 50 per request. Tracks already fetched during this run are served
+        from a cache, so only URIs not seen before cost a round-trip.
+        """
+
+        with self.__track_cache_lock:
+            missing = [uri for uri in dict.fromkeys(track_uris) if uri not in self.__track_cache]
 
-        gathered_tracks = []
-        for batch in batched(track_uris, 50):
-            gathered_tracks.extend(self.__run_with_retry(func=self.__client.tracks, param_1=batch)[C.TRACKS_KEY])
-        return gathered_tracks
+        # The 50-track batches are independent and latency-bound, so issue them concurrently. executor.map yields
+        # results in batch order, and the existing retry handles any 429s this provokes.
+        batches = list(batched(missing, 50))
+        if batches:
+            fetch_batch = lambda batch: self.__run_with_retry(self.__client.tracks, batch)[C.TRACKS_KEY]
+            with ThreadPoolExecutor(max_workers=min(8, len(batches))) as executor:
+                for batch, fetched in zip(batches, executor.map(fetch_batch, batches)):
+                    with self.__track_cache_lock:
+                        for uri, track in zip(batch, fetched):
+                            self.__track_cache.setdefault(uri, track)
+
+        with self.__track_cache_lock:
+            return [self.__track_cache[uri] for uri in track_uris]
 
 
     def removePlaylistItems(self, playlist_id: str, tracks: list) -> None:
-        """Try to remove tracks from a playlist in batches of 100 using the Spotify client."""
+        """
+        Try to remove tracks from a playlist in batches of 100 using the Spotify client. Removals are order-independent,
+        so the batches are issued concurrently.
+        """
 
-        for batch in batched(tracks, 100):
-            self.__run_with_retry(
-                func=self.__client.playlist_remove_all_occurrences_of_items, 
-                param_1=playlist_id, 
-                param_2=batch
-            )
+        batches = list(batched(tracks, 100))
+        if not batches:
+            return
+        remove_batch = lambda batch: self.__run_with_retry(self.__client.playlist_remove_all_occurrences_of_items, playlist_id, batch)
+        with ThreadPoolExecutor(max_workers=min(8, len(batches))) as executor:
+            # Drain the iterator so a failure in any batch propagates to the caller.
+            list(executor.map(remove_batch, batches))
 
 
     def addPlaylistItems(self, playlist_id: str, tracks: list) -> None:
-        """Try to add tracks to a playlist in batches of 100 using the Spotify client."""
+        """
+        Try to add tracks to a playlist in batches of 100 using the Spotify client. Kept serial on purpose: Spotify
+        appends each batch in request order, so concurrent adds would scramble the playlist ordering.
+        """
 
         for batch in batched(tracks, 100):
-            self.__run_with_retry(
-                func=self.__client.playlist_add_items,
-                param_1=playlist_id, 
-                param_2=batch
-            )
+            self.__run_with_retry(self.__client.playlist_add_items, playlist_id, batch)
 
 
     def createUserPlaylist(self, playlist_title: str) -> str:
         """Try to create a playlist using the Spotify client."""
 
-        return self.__run_with_retry(
-            func=self.__client.user_playlist_create,
-            param_1=self.__user,
-            param_2=playlist_title
-        )['uri']
+        return self.__run_with_retry(self.__client.user_playlist_create, self.__user, playlist_title)['uri']
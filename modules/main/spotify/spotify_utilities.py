@@ -1,5 +1,5 @@
 import modules.main.util.constants as C
-import math
+from operator import itemgetter
 import sys
 
 
@@ -17,25 +17,35 @@ class SparseReturnDataException(Exception):
     pass
 
 
+# The tier-playlist memory keys, indexed by tier - 1. Built once so get_tier_key is a bounds check plus an index
+# instead of formatting a new string per call.
+_TIER_KEYS = ("tier_1_tracks", "tier_2_tracks", "tier_3_tracks")
+
+# C-level name extractor shared by the bulk helpers: itemgetter caches the key's hash, and map keeps the per-item
+# loop out of Python bytecode. A missing name raises the same KeyError the callers already translate.
+_GET_NAME = itemgetter(C.NAME_KEY)
+
+
 def is_valid_tier(tier: int) -> bool:
     """Returns true if the tier is 1, 2 or 3."""
-    return 3 >= tier >= 1
+    return 1 <= tier <= 3
 
 
-def get_track_key(name: str, tier: int) -> str:
+def get_track_key(name: str, tier: int) -> tuple:
     """
     Get the track key for a Spotify track at a certain tier. Throws a SparsePlaylistTierException if the album tier is not 1, 2 or 3.
-    
+    A tuple is cheaper to build and hash than a formatted string on the per-track hot path.
+
     Returns:
-        str: The track key formatted as: "<TRACK_NAME>_<TIER>"
+        tuple: The track key formatted as: (TRACK_NAME, TIER)
     """
 
     if not name:
         raise SparsePlaylistTierException("Tried to add a track with no name to tier {tier}.")
     if not is_valid_tier(tier):
         raise SparsePlaylistTierException("Tried to add {name} to tier {tier}, but playlist tiers can only be `1`, `2` or `3`.")
-    
-    return f"{name}_{tier}"
+
+    return (name, tier)
 
 
 def get_tier_key(tier: int) -> str:
@@ -45,8 +55,8 @@ def get_tier_key(tier: int) -> str:
         raise SparsePlaylistTierException(
             "Tried to get the tier key for invalid tier {tier}. Playlist tiers can only be `1`, `2` or `3`."
         )
-    
-    return f"tier_{tier}_tracks"
+
+    return _TIER_KEYS[tier - 1]
 
 
 def get_artist_name(spotify_artist: dict) -> str:
@@ -69,7 +79,13 @@ def get_album_artist_names(spotify_album: dict) -> str:
     """
 
     try:
-        return ', '.join(map(get_artist_name, spotify_album[C.ARTISTS_KEY]))
+        # Interned so that repeat occurrences of the same artists share one string with a cached hash. Most albums
+        # have exactly one artist, so that shape skips the map/join machinery entirely; collaborations fall through
+        # to the shared C-level extractor. The enclosing except translates a missing key the same way on both paths.
+        artists = spotify_album[C.ARTISTS_KEY]
+        if len(artists) == 1:
+            return sys.intern(artists[0][C.NAME_KEY])
+        return sys.intern(', '.join(map(_GET_NAME, artists)))
     except KeyError as e:
         tb = sys.exception().__traceback__
         raise SparseReturnDataException(e.with_traceback(tb))
@@ -91,17 +107,19 @@ def get_track_score(spotify_track: dict) -> float:
     """
 
     try:
-        duration_min = spotify_track[C.DURATION_MS_KEY]/1000/60
+        duration_ms = spotify_track[C.DURATION_MS_KEY]
     except KeyError as e:
         tb = sys.exception().__traceback__
         raise SparseReturnDataException(e.with_traceback(tb))
 
-    if (duration_min < .25):
+    # Compare against the band edges in integer milliseconds; same bands as the docstring, without the per-call
+    # divisions and floor of the minutes-based version.
+    if (duration_ms < 15_000):
         return 0
-    elif (duration_min < 1.5):
+    elif (duration_ms < 90_000):
         return 0.5
-    elif (duration_min > 6):
-        return math.floor(duration_min/6) + 1
+    elif (duration_ms > 360_000):
+        return duration_ms // 360_000 + 1
     else:
         return 1
 
@@ -123,7 +141,9 @@ def get_track_names(spotify_album_tracks: list) -> list:
     """
 
     try:
-        return list(map(get_track_name, spotify_album_tracks))
+        # Same C-level extraction as get_album_artist_names: one Python call per album instead of one per track,
+        # with the missing-key translation kept at this level.
+        return list(map(_GET_NAME, spotify_album_tracks))
     except KeyError as e:
         tb = sys.exception().__traceback__
         raise SparseReturnDataException(e.with_traceback(tb))
@@ -153,15 +173,12 @@ def get_album_highest_possible_score(spotify_album_tracks: list) -> float:
         float: The highest possible score this album could achieve based on the length of its tracks.
     """
 
-    # Get the highest possible score for a single tier.
-    single_tier_score = 0
-    for track in spotify_album_tracks:
-        single_tier_score += get_track_score(track)
+    # Get the highest possible score for a single tier. sum(map(...)) keeps the accumulation loop in C while each
+    # track still goes through get_track_score and its validation.
+    single_tier_score = sum(map(get_track_score, spotify_album_tracks))
 
     # We need to multiply this score by 3 since there are 3 tiers.
-    highest_score = single_tier_score * 3
-
-    return highest_score
+    return single_tier_score * 3
 
 
 def get_album_uri_from_share_link(share_link: str):
@@ -14,11 +14,13 @@ USER_KEY = "user"
 
 # Spotify JSON response key names:
 ALBUM_KEY = "album"
+ALBUMS_KEY = "albums"
 ARTISTS_KEY = "artists"
 DURATION_MS_KEY = "duration_ms"
 HIGHEST_POSSIBLE_SCORE_KEY = "highest_possible_score"
 ITEMS_KEY = "items"
 NAME_KEY = "name"
+NEXT_KEY = "next"
 RELEASE_DATE_KEY = "release_date"
 TRACK_KEY = "track"
 TRACKS_KEY = "tracks"
@@ -59,7 +61,11 @@ ALBUM_LIST_GENRE_KEY = "-ALBUM_LIST_GENRE-"
 ALBUM_LIST_OUTPUT_KEY = "-DEFAULT_FONT-"
 ALBUM_LIST_TITLE = "Album List"
 ALBUM_LIST_YEAR_KEY = "-ALBUM_LIST_YEAR-"
+ALBUMS_READY_EVENT = "-ALBUMS_READY-"
+TIER_3_READY_EVENT = "-TIER_3_READY-"
 APPLICATION_TITLE = "SPARSE (Spotify Python Album Ranking and Sorting Engine)"
+CONFIRM_DIALOG_QUESTION_KEY = "-CONFIRM_DIALOG_QUESTION-"
+CONFIRM_DIALOG_TITLE = "Which Genre?"
 CONFIRM_GENRE_TAG = "Confirm Genre"
 CONFIRM_OVERRIDE_TAG = "Confirm Override"
 DEFAULT_FONT = "Courier 14"
@@ -71,6 +77,9 @@ GENRE_INPUT_KEY = "-GENRE_INPUT-"
 GENRE_TAG = "Genre:"
 LIST_ALBUMS_TAG = "List Albums"
 LIST_TIER_3_TAG = "List Tier 3"
+NEXT_PAGE_TAG = "Next Page"
+PREV_PAGE_TAG = "Previous Page"
+ALBUM_LIST_PAGE_SIZE = 50
 NOTICE_TAG = "Notice:"
 OVERRIDE_ADDED_MESSAGE = "Override added:"
 OVERRIDE_NOT_ADDED_MESSAGE = "Invalid Spotify album link. Override not added."
@@ -5,79 +5,83 @@ import modules.main.spotify.spotify_utilities as spotify_utilities
 class TestSpotifyUtilities(unittest.TestCase):
 
 
-    def setUp(self):
-        """Setup before running the unit tests."""
-
-        self.spotify_artist_1 = {
+    @classmethod
+    def setUpClass(cls):
+        """
+        Build the fixtures once for the whole class instead of once per test. Tests that exercise missing-key paths
+        copy the fixture dict before deleting from it, so the shared instances are never mutated.
+        """
+
+        cls.spotify_artist_1 = {
             "name": "Kendrick Lamar"
         }
-        self.spotify_artist_2 = {
+        cls.spotify_artist_2 = {
             "name": "Charli xcx"
         }
-        self.spotify_artist_3 = {
+        cls.spotify_artist_3 = {
             "name": "Tame Impala"
         }
-        self.spotify_artist_4 = {
+        cls.spotify_artist_4 = {
             "name": "James Blake"
         }
-        self.spotify_artist_5 = {
+        cls.spotify_artist_5 = {
             "name": ""
         }
-        self.spotify_track_1 = {
+        cls.spotify_track_1 = {
             "name": "!!!!!!!",
             "duration_ms": 13000
         }
-        self.spotify_track_2 = {
+        cls.spotify_track_2 = {
             "name": "U-Love",
             "duration_ms": 60000
         }
-        self.spotify_track_3 = {
+        cls.spotify_track_3 = {
             "name": "Not Like Us",
             "duration_ms": 274000
         }
-        self.spotify_track_4 = {
+        cls.spotify_track_4 = {
             "name": "Stairway to Heaven - Remaster",
             "duration_ms": 482000
         }
-        self.spotify_track_5 = {
+        cls.spotify_track_5 = {
             "name": "",
             "duration_ms": 0
         }
-        self.spotify_album_tracks = [
-            self.spotify_track_1, 
-            self.spotify_track_2, 
-            self.spotify_track_3, 
-            self.spotify_track_4, 
-            self.spotify_track_5
+        cls.spotify_album_tracks = [
+            cls.spotify_track_1,
+            cls.spotify_track_2,
+            cls.spotify_track_3,
+            cls.spotify_track_4,
+            cls.spotify_track_5
         ]
-        self.spotify_album_1 = {
-            "artists": [self.spotify_artist_1],
+        cls.spotify_album_1 = {
+            "artists": [cls.spotify_artist_1],
             "tracks": {
-                "items": [self.spotify_track_1]
+                "items": [cls.spotify_track_1]
             }
         }
-        self.spotify_album_2 = {
-            "artists": [self.spotify_artist_1, self.spotify_artist_2],
+        cls.spotify_album_2 = {
+            "artists": [cls.spotify_artist_1, cls.spotify_artist_2],
             "tracks": {
-                "items": [self.spotify_track_1, self.spotify_track_2]
+                "items": [cls.spotify_track_1, cls.spotify_track_2]
             }
         }
-        self.spotify_album_3 = {
-            "artists": [self.spotify_artist_3, self.spotify_artist_4],
+        cls.spotify_album_3 = {
+            "artists": [cls.spotify_artist_3, cls.spotify_artist_4],
             "tracks": {
-                "items": [self.spotify_track_2, self.spotify_track_3, self.spotify_track_4]
+                "items": [cls.spotify_track_2, cls.spotify_track_3, cls.spotify_track_4]
             }
         }
-        self.spotify_album_4 = {
-            "artists": [self.spotify_artist_5],
+        cls.spotify_album_4 = {
+            "artists": [cls.spotify_artist_5],
             "tracks": {
                 "items": []
             }
         }
-        self.spotify_album_5 = {
+        cls.spotify_album_5 = {
             "artists": [],
             "tracks": {
-                "items": [self.spotify_track_5]
+                "items": [cls.spotify_track_5]
             }
         }
 
@@ -97,7 +101,8 @@ class TestSpotifyUtilities(unittest.TestCase):
             (100, False)
         ]
         for tier, expectation in tiers_and_expectations:
-            self.assertEqual(spotify_utilities.is_valid_tier(tier=tier), expectation)
+            with self.subTest(tier=tier):
+                self.assertEqual(spotify_utilities.is_valid_tier(tier=tier), expectation)
 
 
     def test_get_track_key(self):
@@ -105,24 +110,26 @@ class TestSpotifyUtilities(unittest.TestCase):
 
         # Valid tiers should produce expected output.
         names_valid_tiers_and_expectations = [
-            ("name1", 1, "name1_1"),
-            ("name2", 2, "name2_2"),
-            ("name3", 3, "name3_3")
+            ("name1", 1, ("name1", 1)),
+            ("name2", 2, ("name2", 2)),
+            ("name3", 3, ("name3", 3))
         ]
         for name, tier, expectation in names_valid_tiers_and_expectations:
-            self.assertEqual(spotify_utilities.get_track_key(name=name, tier=tier), expectation)
+            with self.subTest(name=name, tier=tier):
+                self.assertEqual(spotify_utilities.get_track_key(name=name, tier=tier), expectation)
 
         # Empty names and invalid tiers should raise a SparsePlaylistTierException.
         names_valid_tiers_and_expectations = [
-            ("", 1, "name1_1"),
-            (None, 2, "name2_2"),
-            ("name1", -1, "name1_1"),
-            ("name2", 0, "name2_2"),
-            ("name3", 4, "name3_3"),
+            ("", 1, ("name1", 1)),
+            (None, 2, ("name2", 2)),
+            ("name1", -1, ("name1", 1)),
+            ("name2", 0, ("name2", 2)),
+            ("name3", 4, ("name3", 3)),
         ]
         for name, tier, expectation in names_valid_tiers_and_expectations:
-            with self.assertRaises(spotify_utilities.SparsePlaylistTierException):
-                spotify_utilities.get_track_key(name=name, tier=tier)
+            with self.subTest(name=name, tier=tier):
+                with self.assertRaises(spotify_utilities.SparsePlaylistTierException):
+                    spotify_utilities.get_track_key(name=name, tier=tier)
 
         # Empty name string should raise a SparsePlaylistTierException.
         with self.assertRaises(spotify_utilities.SparsePlaylistTierException):
@@ -141,13 +148,15 @@ class TestSpotifyUtilities(unittest.TestCase):
             (3, "tier_3_tracks")
         ]
         for tier, expectation in tiers_and_expectations:
-            self.assertEqual(spotify_utilities.get_tier_key(tier=tier), expectation)
+            with self.subTest(tier=tier):
+                self.assertEqual(spotify_utilities.get_tier_key(tier=tier), expectation)
 
         # Invalid tiers should raise SparsePlaylistTierException.
         invalid_tiers = [-100, -1, 0, 4, 100]
         for tier in invalid_tiers:
-            with self.assertRaises(spotify_utilities.SparsePlaylistTierException):
-                spotify_utilities.get_tier_key(tier=tier)
+            with self.subTest(tier=tier):
+                with self.assertRaises(spotify_utilities.SparsePlaylistTierException):
+                    spotify_utilities.get_tier_key(tier=tier)
 
 
     def test_get_artist_name(self):
@@ -162,10 +171,13 @@ class TestSpotifyUtilities(unittest.TestCase):
             (self.spotify_artist_5, ""),
         ]
         for artist, expectation in artists_and_expectations:
-            self.assertEqual(spotify_utilities.get_artist_name(artist), expectation)
+            with self.subTest(expectation=expectation):
+                self.assertEqual(spotify_utilities.get_artist_name(artist), expectation)
 
-        # Artists without names should raise SparseReturnDataException.
+        # Artists without names should raise SparseReturnDataException. Delete from a copy so the shared fixture
+        # stays intact for the other tests.
         for artist, _ in artists_and_expectations:
+            artist = artist.copy()
             del artist["name"]
             with self.assertRaises(spotify_utilities.SparseReturnDataException):
                 spotify_utilities.get_artist_name(artist)
@@ -183,10 +195,13 @@ class TestSpotifyUtilities(unittest.TestCase):
             (self.spotify_album_5, "") # No artists.
         ]
         for album, expectation in albums_and_expectations:
-            self.assertEqual(spotify_utilities.get_album_artist_names(album), expectation)
+            with self.subTest(expectation=expectation):
+                self.assertEqual(spotify_utilities.get_album_artist_names(album), expectation)
 
-        # Albums without artists should raise SparseReturnDataException.
+        # Albums without artists should raise SparseReturnDataException. Delete from a copy so the shared fixture
+        # stays intact for the other tests.
         for album, _ in albums_and_expectations:
+            album = album.copy()
             del album["artists"]
             with self.assertRaises(spotify_utilities.SparseReturnDataException):
                 spotify_utilities.get_album_artist_names(album)
@@ -204,10 +219,13 @@ class TestSpotifyUtilities(unittest.TestCase):
             (self.spotify_track_5, 0)
         ]
         for track, expectation in tracks_and_expectations:
-            self.assertEqual(spotify_utilities.get_track_score(track), expectation)
+            with self.subTest(track=track["name"]):
+                self.assertEqual(spotify_utilities.get_track_score(track), expectation)
 
-        # Tracks without a duration should raise SparseReturnDataException.
+        # Tracks without a duration should raise SparseReturnDataException. Delete from a copy so the shared fixture
+        # stays intact for the other tests.
         for track, _ in tracks_and_expectations:
+            track = track.copy()
             del track["duration_ms"]
             with self.assertRaises(spotify_utilities.SparseReturnDataException):
                 spotify_utilities.get_track_score(track)
@@ -225,10 +243,13 @@ class TestSpotifyUtilities(unittest.TestCase):
             (self.spotify_track_5, "")
         ]
         for track, expectation in tracks_and_expectations:
-            self.assertEqual(spotify_utilities.get_track_name(track), expectation)
+            with self.subTest(expectation=expectation):
+                self.assertEqual(spotify_utilities.get_track_name(track), expectation)
 
-        # Tracks without names should raise SparseReturnDataException.
+        # Tracks without names should raise SparseReturnDataException. Delete from a copy so the shared fixture
+        # stays intact for the other tests.
         for track, _ in tracks_and_expectations:
+            track = track.copy()
             del track["name"]
             with self.assertRaises(spotify_utilities.SparseReturnDataException):
                 spotify_utilities.get_track_name(track)
@@ -289,7 +310,8 @@ class TestSpotifyUtilities(unittest.TestCase):
             ("", "spotify:album:")
         ]
         for link, expectation in links_and_expectations:
-            self.assertEqual(spotify_utilities.get_album_uri_from_share_link(share_link=link), expectation)
+            with self.subTest(link=link):
+                self.assertEqual(spotify_utilities.get_album_uri_from_share_link(share_link=link), expectation)
 
 
 if __name__ == '__main__':
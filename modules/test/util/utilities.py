@@ -1,4 +1,6 @@
 import datetime as dt
+import os
+import tempfile
 import unittest
 import modules.main.util.utilities as utilities
 
@@ -6,6 +8,25 @@ import modules.main.util.utilities as utilities
 class TestSparseConfigsValidation(unittest.TestCase):
 
 
+    def test_atomic_write_json(self):
+        """Test atomic_write_json()."""
+
+        data = {"key1": "value", "key2": 2, "key3": {"nested": [1, 2, 3]}}
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "test.json")
+
+            # Data written to disk should read back unchanged.
+            utilities.atomic_write_json(file_path=file_path, data=data)
+            self.assertEqual(utilities.read_json_file(file_path=file_path), data)
+
+            # The temporary file should be swapped away after the write.
+            self.assertFalse(os.path.exists(f"{file_path}.tmp"))
+
+            # Overwriting an existing file should replace its contents.
+            utilities.atomic_write_json(file_path=file_path, data={"key1": "new"})
+            self.assertEqual(utilities.read_json_file(file_path=file_path), {"key1": "new"})
+
+
     def test_extract_year_from_date(self):
         """Test extract_year_from_date()."""
         
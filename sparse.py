@@ -4,27 +4,43 @@ from modules.main.ranking.album_ranker import AlbumRanker
 from modules.main.sorting.album_sorter import AlbumSorter
 from modules.main.gui.sparse_ranker_popup import SparseRankerPopup
 from modules.main.gui.sparse_sorter_window import SparseSorterWindow
-from multiprocessing import Process
-import time
-
-configs = SparseConfigs()
-client = SpotifyClient(configs=configs)
-ranker = AlbumRanker(configs=configs, client=client)
-ranker_popup = SparseRankerPopup(ranker=ranker)
-sorter = AlbumSorter(configs=configs, client=client)
-sorter_window = SparseSorterWindow(sorter=sorter)
+import multiprocessing
+from multiprocessing import Event, Process
+import logging
 
 if __name__ == "__main__":
-    p1 = Process(target=sorter_window.run)
+    # Pin the fork start method where it exists: the children then share the already-parsed configs and Spotify
+    # session copy-on-write instead of rebuilding them, and a future change to the platform default can't silently
+    # switch us to spawn. Falls through on platforms without fork or when a method is already set.
+    try:
+        multiprocessing.set_start_method("fork")
+    except (RuntimeError, ValueError):
+        pass
+
+    # Configure logging here rather than at album_ranker import time so importing ranker code never writes to disk.
+    logging.basicConfig(filename='./log/album_ranker.log', level=logging.INFO)
+
+    # Everything is built inside the main guard so spawn-based platforms don't repeat the config loads and Spotify
+    # authentication in every child process when this module is re-imported.
+    configs = SparseConfigs()
+    client = SpotifyClient(configs=configs)
+    ranker = AlbumRanker(configs=configs, client=client)
+    ranker_popup = SparseRankerPopup(ranker=ranker)
+    sorter = AlbumSorter(configs=configs, client=client)
+    sorter_window = SparseSorterWindow(sorter=sorter)
+
+    window_ready = Event()
+    p1 = Process(target=sorter_window.run, args=(window_ready,))
     p2 = Process(target=ranker_popup.run)
 
     p1.start()
 
-    # Start p2 one second after p1 to ensure that the pop-up appears on top of the window.
-    time.sleep(1)
+    # Start p2 once the sorter window is actually on screen (with a timeout in case p1 dies before opening it), so
+    # the pop-up appears on top of the window without a fixed one-second sleep.
+    window_ready.wait(timeout=5)
     p2.start()
 
     p1.join()
     p2.join()
 
-    print("Done!")
\ No newline at end of file
+    print("Done!")